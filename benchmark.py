@@ -0,0 +1,149 @@
+import argparse
+import contextlib
+import json
+import random
+import re
+import sys
+import time
+from collections import defaultdict
+
+from champions import POSITIONS, load_champions_data, select_random_team
+from lcu import LCUClient, LobbyBuilder
+from mock_lcu import MockLCUServer
+
+ID_SUFFIX = re.compile(r'/\d+$')
+
+
+def percentiles(samples):
+    """返回样本的分位数统计（毫秒）"""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def pick(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered) * 1000,
+        "p50": pick(0.50),
+        "p90": pick(0.90),
+        "p99": pick(0.99),
+        "max": ordered[-1] * 1000,
+    }
+
+
+class RequestRecorder:
+    """包装LCUTransport.request，按“方法 接口”记录每个请求的耗时"""
+
+    def __init__(self, transport):
+        self.timings = defaultdict(list)
+        self._request = transport.request
+        transport.request = self.request
+
+    def request(self, endpoint, method='GET', data=None, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self._request(endpoint, method, data, **kwargs)
+        finally:
+            # 人机ID等路径参数归为同一个接口
+            self.timings[f"{method} {ID_SUFFIX.sub('/{id}', endpoint)}"].append(time.perf_counter() - start)
+
+
+def run_scenario(client, builds, make_job):
+    """重复执行建房，返回总耗时、各阶段耗时和成功次数的统计"""
+    durations, phases, successes = [], defaultdict(list), 0
+    start = time.perf_counter()
+    for i in range(builds):
+        room_name, team = make_job(i)
+        builder = LobbyBuilder(client, room_name, "bench", team)
+        build_start = time.perf_counter()
+        success, _ = builder.run()
+        durations.append(time.perf_counter() - build_start)
+        successes += success
+        for phase, seconds in builder.timings.items():
+            phases[phase].append(seconds)
+    elapsed = time.perf_counter() - start
+    return {
+        "builds": builds,
+        "success": successes,
+        "build_ms": percentiles(durations),
+        "phases_ms": {phase: percentiles(samples) for phase, samples in phases.items()},
+        "throughput_per_s": builds / elapsed if elapsed else None,
+    }
+
+
+def run_benchmark(builds=20, latency=0.0, jitter=0.0, failure_rate=0.0, create_delay=0.05, bot_delay=0.02,
+                  concurrency=5, websocket=True, seed=0):
+    champions_data = load_champions_data()
+    rng = random.Random(seed)
+    server = MockLCUServer(latency=latency, jitter=jitter, failure_rate=failure_rate, create_delay=create_delay,
+                           bot_delay=bot_delay, websocket=websocket, seed=seed)
+    server.start()
+    client = LCUClient(server.port, server.auth_token, max_concurrency=concurrency)
+    recorder = RequestRecorder(client.transport)
+    try:
+        scenarios = {}
+        # 每次使用新的房间名，走完整的建房流程
+        scenarios["full_build"] = run_scenario(
+            client, builds, lambda i: (f"bench-{i}", select_random_team(champions_data, rng)))
+
+        # 同一房间内每次只换一个英雄，走增量调整流程
+        team = select_random_team(champions_data, rng)
+
+        def change_one(i):
+            position = POSITIONS[i % len(POSITIONS)]
+            used = {member['champion_id'] for member in team.values()}
+            team[position] = champions_data.team_member(champions_data.sample(position, used, rng), position)
+            return "bench-reconcile", dict(team)
+
+        scenarios["reconcile_one_change"] = run_scenario(client, builds, change_one)
+
+        # 房间已完全符合要求时不应发出任何修改请求
+        scenarios["noop_rebuild"] = run_scenario(client, builds, lambda i: ("bench-reconcile", dict(team)))
+
+        return {
+            "config": {
+                "builds": builds, "latency": latency, "jitter": jitter, "failure_rate": failure_rate,
+                "create_delay": create_delay, "bot_delay": bot_delay, "concurrency": concurrency,
+                "websocket": websocket, "seed": seed,
+            },
+            "scenarios": scenarios,
+            "requests_ms": {key: percentiles(samples) for key, samples in sorted(recorder.timings.items())},
+            "server": {"requests": server.request_count, "connections": server.connection_count},
+        }
+    finally:
+        client.close()
+        server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="基于模拟LCU的建房性能测试，结果以JSON输出")
+    parser.add_argument('--builds', type=int, default=20, help="每个场景的建房次数")
+    parser.add_argument('--latency', type=float, default=0.0, help="模拟的请求延迟（秒）")
+    parser.add_argument('--jitter', type=float, default=0.0, help="模拟的延迟抖动上限（秒）")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="模拟的请求失败率")
+    parser.add_argument('--create-delay', type=float, default=0.05, help="房间创建完成所需时间（秒）")
+    parser.add_argument('--bot-delay', type=float, default=0.02, help="人机进入房间所需时间（秒）")
+    parser.add_argument('--concurrency', type=int, default=5, help="人机增删的最大并发数")
+    parser.add_argument('--no-websocket', action='store_true', help="不使用房间事件，测试轮询路径")
+    parser.add_argument('--seed', type=int, default=0, help="随机种子")
+    parser.add_argument('--output', help="结果输出文件，默认输出到标准输出")
+    args = parser.parse_args()
+
+    # 请求出错等诊断信息输出到标准错误，标准输出只有JSON结果
+    with contextlib.redirect_stdout(sys.stderr):
+        result = run_benchmark(builds=args.builds, latency=args.latency, jitter=args.jitter,
+                               failure_rate=args.failure_rate, create_delay=args.create_delay,
+                               bot_delay=args.bot_delay, concurrency=args.concurrency,
+                               websocket=not args.no_websocket, seed=args.seed)
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
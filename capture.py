@@ -0,0 +1,288 @@
+import functools
+import gzip
+import json
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from lcu import LCUClient, LCUTransport, OperationCancelled, credential_provider
+
+# 录制文件格式版本，记录格式变化时递增
+CAPTURE_VERSION = 1
+# 回放时按名称还原的请求异常
+ERROR_TYPES = {cls.__name__: cls for cls in (requests.ConnectTimeout, requests.ReadTimeout, requests.Timeout,
+                                             requests.ConnectionError)}
+
+
+def _port_of(base_url):
+    return str(urlsplit(base_url).port)
+
+
+def _body_key(data):
+    return json.dumps(data, sort_keys=True, ensure_ascii=False) if data is not None else None
+
+
+class CaptureWriter:
+    """把LCU请求和房间事件写入gzip压缩的JSON Lines文件，多个客户端可共用一个
+
+    每行是一个列表，时间为相对录制开始的秒数：
+      ["http", 端口, 开始时间, 耗时, 方法, 接口, 请求体, 状态码, 响应文本]
+      ["error", 端口, 开始时间, 耗时, 方法, 接口, 请求体, 异常类名]
+      ["ws_open", 端口, 连接建立时间, 连接序号, 建立连接耗时] / ["ws", 端口, 时间, 连接序号, 消息]
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = gzip.open(path, 'wt', encoding='utf-8')
+        self._started = time.monotonic()
+        self._connections = 0
+        self._write(["capture", CAPTURE_VERSION, time.time()])
+
+    def now(self):
+        return time.monotonic() - self._started
+
+    def _write(self, record):
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line + "\n")
+
+    def http(self, port, start, duration, method, endpoint, data, status, body):
+        self._write(["http", port, round(start, 6), round(duration, 6), method, endpoint, data, status, body])
+
+    def error(self, port, start, duration, method, endpoint, data, error):
+        self._write(["error", port, round(start, 6), round(duration, 6), method, endpoint, data,
+                     type(error).__name__])
+
+    def ws_open(self, port, duration):
+        with self._lock:
+            self._connections += 1
+            connection = self._connections
+        self._write(["ws_open", port, round(self.now(), 6), connection, round(duration, 6)])
+        return connection
+
+    def ws_message(self, port, connection, message):
+        self._write(["ws", port, round(self.now(), 6), connection, message])
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class RecordingSocket:
+    """包装WebSocket连接，记录收到的每条消息"""
+
+    def __init__(self, ws, writer, port, duration):
+        self._ws = ws
+        self._writer = writer
+        self._port = port
+        self._connection = writer.ws_open(port, duration)
+
+    def send(self, message):
+        self._ws.send(message)
+
+    def recv(self):
+        message = self._ws.recv()
+        self._writer.ws_message(self._port, self._connection, message)
+        return message
+
+    def settimeout(self, timeout):
+        self._ws.settimeout(timeout)
+
+    def close(self):
+        self._ws.close()
+
+
+class RecordingTransport(LCUTransport):
+    """照常发送请求，同时记录每次实际发出的请求（含重试）、响应和耗时"""
+
+    def __init__(self, base_url, headers, pool_size=10, writer=None, **kwargs):
+        super().__init__(base_url, headers, pool_size=pool_size, **kwargs)
+        self.writer = writer
+        self.port = _port_of(base_url)
+
+    def _send(self, method, endpoint, data, timeout, token, status):
+        start = self.writer.now()
+        try:
+            response = super()._send(method, endpoint, data, timeout, token, status)
+        except requests.RequestException as e:
+            self.writer.error(self.port, start, self.writer.now() - start, method, endpoint, data, e)
+            raise
+        self.writer.http(self.port, start, self.writer.now() - start, method, endpoint, data,
+                         response.status_code, response.text)
+        return response
+
+    def open_websocket(self, timeout=1):
+        start = self.writer.now()
+        ws = super().open_websocket(timeout)
+        return RecordingSocket(ws, self.writer, self.port, self.writer.now() - start) if ws is not None else None
+
+
+class Capture:
+    """加载后的录制文件，按端口和(方法, 接口)分组，供ReplayTransport按顺序取用"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._replayed = threading.Condition(self._lock)  # 有记录被取用时通知
+        self._http = {}  # {(端口, 方法, 接口): [[记录, 是否已使用]]}
+        self._ws = {}  # {端口: [(建立连接耗时, [(相对连接时刻, 消息, 之前最后完成的请求)])]}
+        self.ports = []
+        connections = {}
+        last_http = {}  # {端口: 文件中最近一条请求记录}，记录按完成先后写入
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            header = json.loads(f.readline() or "null")
+            if not isinstance(header, list) or header[:2] != ["capture", CAPTURE_VERSION]:
+                raise ValueError(f"{path} 不是可用的录制文件")
+            for line in f:
+                record = json.loads(line)
+                kind, port = record[0], record[1]
+                if port not in self.ports:
+                    self.ports.append(port)
+                if kind in ("http", "error"):
+                    entry = [record, False]
+                    self._http.setdefault((port, record[4], record[5]), []).append(entry)
+                    last_http[port] = entry
+                elif kind == "ws_open":
+                    messages = []
+                    connections[record[3]] = (record[2], messages)
+                    self._ws.setdefault(port, []).append((record[4], messages))
+                elif kind == "ws" and record[3] in connections:
+                    opened, messages = connections[record[3]]
+                    messages.append((record[2] - opened, record[4], last_http.get(port)))
+
+    def next_http(self, port, method, endpoint, data):
+        """取下一条匹配的记录：优先请求体相同的，其次同一接口的；都用完后重复最后一条，没有时返回None"""
+        entries = self._http.get((port, method, endpoint))
+        if not entries:
+            return None
+        body = _body_key(data)
+        with self._lock:
+            unused = [entry for entry in entries if not entry[1]]
+            entry = next((entry for entry in unused if _body_key(entry[0][6]) == body), None)
+            entry = entry or (unused[0] if unused else entries[-1])
+            entry[1] = True
+            self._replayed.notify_all()
+            return entry[0]
+
+    def wait_replayed(self, entry, timeout, closed):
+        """等待entry这条请求记录被回放，超时或closed被设置时返回"""
+        with self._replayed:
+            self._replayed.wait_for(lambda: entry is None or entry[1] or closed.is_set(), timeout)
+
+    def wake(self):
+        with self._replayed:
+            self._replayed.notify_all()
+
+    def next_websocket(self, port):
+        """返回(建立连接耗时, 消息列表)，录制中没有更多连接时返回None"""
+        with self._lock:
+            connections = self._ws.get(port)
+            return connections.pop(0) if connections else None
+
+
+class ReplaySocket:
+    """按录制时的相对时间（乘以time_scale）依次返回消息，消息用完后阻塞到被关闭
+
+    录制时一条消息之前已完成的请求回放之前不返回这条消息，任何time_scale下消息与请求的先后顺序都与录制时一致；
+    该请求在HOLD_TIMEOUT秒内仍未回放（如被回放的代码少发了这个请求）时不再等待。
+    """
+    HOLD_TIMEOUT = 1.0
+
+    def __init__(self, messages, time_scale=1.0, capture=None):
+        self._messages = list(messages)
+        self._time_scale = time_scale
+        self._capture = capture
+        self._opened = time.monotonic()
+        self._closed = threading.Event()
+
+    def send(self, message):
+        pass
+
+    def settimeout(self, timeout):
+        pass
+
+    def recv(self):
+        if self._messages:
+            offset, message, after = self._messages[0]
+            remaining = self._opened + offset * self._time_scale - time.monotonic()
+            if remaining <= 0 or not self._closed.wait(remaining):
+                if self._capture is not None:
+                    self._capture.wait_replayed(after, self.HOLD_TIMEOUT, self._closed)
+                if not self._closed.is_set():
+                    self._messages.pop(0)
+                    return message
+        self._closed.wait()
+        raise ConnectionError("回放的连接已关闭")
+
+    def close(self):
+        self._closed.set()
+        if self._capture is not None:
+            self._capture.wake()
+
+
+class ReplayTransport(LCUTransport):
+    """不访问客户端，按录制文件返回响应，耗时为录制时的耗时乘以time_scale（0为不等待）
+
+    重试、熔断、取消和指标统计仍走LCUTransport原有逻辑，可离线对比不同版本建房流程的耗时。
+    录制中没有的请求返回404。
+    """
+
+    def __init__(self, base_url, headers, pool_size=10, capture=None, time_scale=1.0, **kwargs):
+        super().__init__(base_url, headers, pool_size=pool_size, **kwargs)
+        self.capture = capture
+        self.time_scale = time_scale
+        self.port = _port_of(base_url)
+
+    def _send(self, method, endpoint, data, timeout, token, status):
+        record = self.capture.next_http(self.port, method, endpoint, data)
+        if record is not None:
+            delay = record[3] * self.time_scale
+            if token is not None:
+                try:
+                    token.sleep(delay)
+                except OperationCancelled:
+                    status[0] = "cancelled"
+                    raise
+            elif delay > 0:
+                time.sleep(delay)
+        if record is not None and record[0] == "error":
+            raise ERROR_TYPES.get(record[7], requests.ConnectionError)(f"回放录制的错误: {record[7]}")
+
+        response = requests.Response()
+        response.status_code, body = (record[7], record[8]) if record is not None else (404, "")
+        response._content = body.encode('utf-8')
+        response.encoding = 'utf-8'
+        response.headers['Content-Type'] = 'application/json'
+        response.url = f"{self.base_url}{endpoint}"
+        return response
+
+    def open_websocket(self, timeout=1):
+        """录制时没有房间事件连接（如未安装websocket-client）时同样返回None，就绪检测改用轮询"""
+        connection = self.capture.next_websocket(self.port)
+        if connection is None:
+            return None
+        duration, messages = connection
+        if duration * self.time_scale > 0:
+            time.sleep(duration * self.time_scale)
+        return ReplaySocket(messages, self.time_scale, self.capture)
+
+
+def install_recording(path):
+    """之后创建的LCUClient都会录制请求，返回CaptureWriter（退出前需close）"""
+    writer = CaptureWriter(path)
+    LCUClient.transport_factory = functools.partial(RecordingTransport, writer=writer)
+    return writer
+
+
+def install_replay(path, time_scale=1.0):
+    """之后创建的LCUClient都从录制文件回放，凭证固定为录制中出现的端口"""
+    capture = Capture(path)
+    LCUClient.transport_factory = functools.partial(ReplayTransport, capture=capture, time_scale=time_scale)
+    credential_provider.pin([(port, "replay") for port in capture.ports])
+    return capture
@@ -0,0 +1,218 @@
+import hashlib
+import json
+import os
+import threading
+
+from champions import POSITIONS, ChampionCatalog, cache_path_for, load_champions_data, read_cache, write_cache
+
+SYNC_FILE = "ai_champions_synced.json"
+# 同步文件格式版本，格式变化时递增，旧文件会在下次连接客户端时重新同步
+SCHEMA_VERSION = 1
+
+# 本地没有覆盖配置的新英雄，按客户端给出的职业推断可用位置
+ROLE_POSITIONS = {
+    "marksman": "BOTTOM",
+    "support": "UTILITY",
+    "mage": "MIDDLE",
+    "assassin": "MIDDLE",
+    "fighter": "TOP",
+    "tank": "TOP",
+}
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def merge_champions(summary, overrides, available_bots=None):
+    """合并客户端英雄概要与本地英雄数据
+
+    名称和英文名以客户端为准；positions和enable以本地数据为准。
+    本地没有的新英雄按职业推断位置，只有确认可以作为人机时才启用。
+    客户端没有列出的本地英雄原样保留。
+    """
+    merged = {key: dict(champ) for key, champ in overrides.items()}
+    for champion in summary:
+        champ_id = champion.get('id')
+        if not isinstance(champ_id, int) or champ_id <= 0:
+            continue
+        key = str(champ_id)
+        local = merged.get(key)
+        if local is not None:
+            local['name'] = champion.get('name') or local.get('name', '')
+            local['alias'] = champion.get('alias') or local.get('alias', '')
+            continue
+        positions = []
+        for role in champion.get('roles') or []:
+            position = ROLE_POSITIONS.get(role)
+            if position and position not in positions:
+                positions.append(position)
+        merged[key] = {
+            'id': champ_id,
+            'name': champion.get('name', ''),
+            'alias': champion.get('alias', ''),
+            'title': champion.get('description', ''),
+            'positions': positions or list(POSITIONS),
+            'enable': 1 if available_bots is not None and champ_id in available_bots else 0,
+        }
+    return merged
+
+
+def _read_overrides(overrides_file):
+    try:
+        with open(overrides_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def read_sync_file(sync_file=SYNC_FILE):
+    """读取同步文件，不存在、损坏或格式版本不符时返回None"""
+    try:
+        with open(sync_file, 'rb') as f:
+            return _parse_sync_state(f.read())
+    except OSError:
+        return None
+
+
+def _parse_sync_state(raw):
+    try:
+        state = json.loads(raw.decode('utf-8'))
+    except ValueError:
+        return None
+    if not isinstance(state, dict) or state.get('schema') != SCHEMA_VERSION:
+        return None
+    return state
+
+
+def write_sync_file(state, sync_file=SYNC_FILE):
+    """原子写入同步文件，返回写入的内容"""
+    raw = json.dumps(state, ensure_ascii=False).encode('utf-8')
+    tmp_path = f"{sync_file}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(raw)
+    os.replace(tmp_path, sync_file)
+    return raw
+
+
+def _catalog(champions):
+    return ChampionCatalog((k, v) for k, v in champions.items() if v.get('enable', 1) == 1)
+
+
+def _source_hash(raw, overrides_stamp):
+    # 本地文件的修改时间也计入：同步文件只是被touch时沿用缓存，本地文件变化时重新合并
+    return f"{hashlib.sha256(raw).hexdigest()}:{overrides_stamp}"
+
+
+def load_catalog(overrides_file="ai_champions_data.json", sync_file=SYNC_FILE, use_cache=True):
+    """加载英雄数据：有同步结果时使用合并后的数据，否则直接使用本地文件（不访问客户端）
+
+    合并结果与本地文件一样写入编译好的启动缓存，以同步文件和本地文件的(修改时间, 大小)为键，
+    之后启动直接读取缓存。本地文件在同步之后被修改时，用同步文件中保存的客户端概要重新合并，无需重新同步。
+    """
+    sync_stamp = _stamp(sync_file)
+    if sync_stamp is None:
+        return load_champions_data(overrides_file, use_cache)
+    overrides_stamp = _stamp(overrides_file)
+    cache_path = cache_path_for(sync_file)
+    if use_cache:
+        cached = read_cache(cache_path, [sync_stamp, overrides_stamp])
+        if cached:
+            return ChampionCatalog(cached[0], cached[1])
+
+    try:
+        with open(sync_file, 'rb') as f:
+            raw = f.read()
+    except OSError:
+        return load_champions_data(overrides_file, use_cache)
+    source_hash = _source_hash(raw, overrides_stamp)
+    if use_cache:
+        cached = read_cache(cache_path, None, source_hash)
+        if cached:
+            catalog = ChampionCatalog(cached[0], cached[1])
+            write_cache(cache_path, [sync_stamp, overrides_stamp], source_hash, catalog)
+            return catalog
+
+    state = _parse_sync_state(raw)
+    if state is None:
+        return load_champions_data(overrides_file, use_cache)
+    if state.get('overrides_stamp') != overrides_stamp:
+        try:
+            overrides = _read_overrides(overrides_file)
+        except Exception as e:
+            print(f"❌ 加载文件时出错: {e}")
+            return None
+        state['champions'] = merge_champions(state['summary'], overrides, _as_set(state.get('available_bots')))
+        state['overrides_stamp'] = overrides_stamp
+        try:
+            raw = write_sync_file(state, sync_file)
+            sync_stamp, source_hash = _stamp(sync_file), _source_hash(raw, overrides_stamp)
+        except OSError:
+            pass
+    catalog = _catalog(state['champions'])
+    if use_cache:
+        write_cache(cache_path, [sync_stamp, overrides_stamp], source_hash, catalog)
+    return catalog
+
+
+def _as_set(ids):
+    return set(ids) if ids is not None else None
+
+
+class CatalogSync:
+    """从客户端同步英雄列表，只在客户端游戏版本变化时才重新拉取英雄概要"""
+
+    def __init__(self, client, overrides_file="ai_champions_data.json", sync_file=SYNC_FILE):
+        self.client = client
+        self.overrides_file = overrides_file
+        self.sync_file = sync_file
+
+    def refresh(self, force=False):
+        """需要时同步，返回新的ChampionCatalog；已是最新或同步失败时返回None"""
+        game_version = self.client.get_game_version()
+        if not game_version:
+            return None
+        state = read_sync_file(self.sync_file)
+        if not force and state is not None and state.get('game_version') == game_version:
+            return None
+
+        summary = self.client.get_champion_summary()
+        if not isinstance(summary, list):
+            return None
+        available_bots = self.client.get_available_bots()
+        # 拿不到人机列表时沿用上次同步的结果
+        if available_bots is None and state is not None:
+            available_bots = _as_set(state.get('available_bots'))
+
+        overrides = _read_overrides(self.overrides_file)
+        summary = [{key: champion.get(key) for key in ('id', 'name', 'alias', 'description', 'roles')}
+                   for champion in summary if isinstance(champion, dict)]
+        champions = merge_champions(summary, overrides, available_bots)
+        write_sync_file({
+            'schema': SCHEMA_VERSION,
+            'game_version': game_version,
+            'overrides_stamp': _stamp(self.overrides_file),
+            'summary': summary,
+            'available_bots': sorted(available_bots) if available_bots is not None else None,
+            'champions': champions,
+        }, self.sync_file)
+        return _catalog(champions)
+
+    def start(self, on_updated=None):
+        """在后台线程中同步，英雄列表有变化时在该线程中调用on_updated(catalog)"""
+        def run():
+            try:
+                catalog = self.refresh()
+            except Exception as e:
+                print(f"同步英雄列表失败: {e}")
+                return
+            if catalog is not None and on_updated:
+                on_updated(catalog)
+
+        thread = threading.Thread(target=run, name="catalog-sync", daemon=True)
+        thread.start()
+        return thread
@@ -0,0 +1,328 @@
+import contextlib
+import hashlib
+import json
+import marshal
+import os
+import random
+
+POSITIONS = ["TOP", "JUNGLE", "MIDDLE", "BOTTOM", "UTILITY"]
+
+
+class ChampionCatalog(dict):
+    """启用的英雄数据（以字符串ID为键），加载时一次性建立各类索引
+
+    position_ids为每个位置的英雄ID数组，by_id/by_alias分别按数字ID和英文名（小写）查找，
+    随机选英雄时直接在位置数组上按下标取样，不再每次筛选整个字典。
+    """
+
+    def __init__(self, data=(), position_ids=None):
+        super().__init__(data)
+        self.by_id = {}
+        self.by_alias = {}
+        # 从启动缓存加载时直接使用缓存里的位置索引
+        self.position_ids = position_ids if position_ids is not None else {position: [] for position in POSITIONS}
+        self._position_sets = {}
+        for key, champ_data in self.items():
+            champ_id = int(key)
+            self.by_id[champ_id] = champ_data
+            if champ_data.get('alias'):
+                self.by_alias[champ_data['alias'].lower()] = champ_data
+            if position_ids is None:
+                for position in champ_data.get('positions', []):
+                    self.position_ids.setdefault(position, []).append(champ_id)
+        for position, ids in self.position_ids.items():
+            self._position_sets[position] = frozenset(ids)
+        self._search_index = None
+
+    @property
+    def search_index(self):
+        """英雄搜索索引，首次使用时建立"""
+        if self._search_index is None:
+            self._search_index = ChampionSearchIndex(self)
+        return self._search_index
+
+    def search(self, query, position=None):
+        """按名称、称号、英文名或拼音前缀搜索，返回英雄ID列表；position给出时只返回该位置的英雄"""
+        ids = self.search_index.search(query)
+        if position is None:
+            return list(ids)
+        position_set = self._position_sets.get(position, frozenset())
+        return [champ_id for champ_id in ids if champ_id in position_set]
+
+    def find(self, name):
+        """按数字ID或英文名查找英雄，返回(英雄ID, 英雄数据)，找不到时返回(None, None)"""
+        if str(name) in self:
+            return int(name), self[str(name)]
+        champ_data = self.by_alias.get(str(name).lower())
+        return (champ_data['id'], champ_data) if champ_data else (None, None)
+
+    def sample(self, position, exclude=(), rng=random):
+        """从该位置随机选一个不在exclude中的英雄ID，全部被排除时允许重复，没有英雄时返回None"""
+        ids = self.position_ids.get(position)
+        if not ids:
+            return None
+        # exclude只有几个元素，拒绝采样的期望次数是常数
+        position_set = self._position_sets[position]
+        if sum(1 for champ_id in exclude if champ_id in position_set) >= len(ids):
+            return ids[rng.randrange(len(ids))]
+        while True:
+            champ_id = ids[rng.randrange(len(ids))]
+            if champ_id not in exclude:
+                return champ_id
+
+    def team_member(self, champ_id, position):
+        """生成队伍中一个位置的英雄信息"""
+        champ_data = self.by_id[int(champ_id)]
+        return {
+            'champion_id': int(champ_id),
+            'name': champ_data['name'],
+            'alias': champ_data['alias'],
+            'primary_position': position
+        }
+
+
+def _import_pypinyin():
+    """pypinyin为可选依赖，缺失时搜索不支持拼音"""
+    try:
+        import pypinyin
+    except ImportError:
+        return None
+    return pypinyin
+
+
+def normalize_search_text(text):
+    """统一大小写并去掉空格、间隔号等符号，如“Kog'Maw”与“kogmaw”视为相同"""
+    return ''.join(char for char in str(text).lower() if char.isalnum())
+
+
+def search_keys(champ_data, pypinyin=None):
+    """一个英雄可被搜索到的全部键：名称、称号、英文名，以及名称和称号的全拼和拼音首字母"""
+    texts = [champ_data.get('name', ''), champ_data.get('title', '')]
+    keys = texts + [champ_data.get('alias', '')]
+    if pypinyin is not None:
+        for text in texts:
+            syllables = [syllable for syllable in pypinyin.lazy_pinyin(text) if syllable]
+            keys += [''.join(syllables), ''.join(syllable[0] for syllable in syllables)]
+    return {key for key in map(normalize_search_text, keys) if key}
+
+
+class ChampionSearchIndex:
+    """英雄搜索用的前缀树，建立后每次按键只需沿查询串走len(query)步
+
+    每个节点保存所有以该前缀开头的英雄ID（按catalog顺序），查询时直接返回，不必遍历子树。
+    """
+
+    def __init__(self, catalog, pypinyin=None):
+        pypinyin = pypinyin or _import_pypinyin()
+        self.ids = tuple(catalog.by_id)
+        self._root = ({}, self.ids)  # 节点为(子节点字典, 英雄ID列表)
+        for champ_id, champ_data in catalog.by_id.items():
+            for key in search_keys(champ_data, pypinyin):
+                node = self._root
+                for char in key:
+                    child = node[0].get(char)
+                    if child is None:
+                        child = node[0][char] = ({}, [])
+                    # 同一英雄的多个键可能经过同一节点
+                    if not child[1] or child[1][-1] != champ_id:
+                        child[1].append(champ_id)
+                    node = child
+
+    def search(self, query):
+        """返回匹配前缀的英雄ID序列，空查询返回全部"""
+        node = self._root
+        for char in normalize_search_text(query):
+            node = node[0].get(char)
+            if node is None:
+                return ()
+        return node[1]
+
+
+def as_catalog(champions_data):
+    return champions_data if isinstance(champions_data, ChampionCatalog) else ChampionCatalog(champions_data)
+
+
+# 启动缓存格式版本，缓存内容或marshal格式变化时递增
+CACHE_VERSION = (1, marshal.version)
+
+
+def cache_path_for(filename):
+    return os.path.splitext(filename)[0] + ".cache"
+
+
+def read_cache(cache_path, stamp, source_hash=None):
+    """读取启动缓存，返回(启用的英雄列表, 位置索引, 源文件哈希)
+
+    缓存记录源文件的(修改时间, 大小)和SHA-256：修改时间和大小一致时直接使用；
+    不一致时只有source_hash与缓存中的哈希相同才使用（文件被touch但内容未变）。
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            # marshal.load直接读文件对象时是逐段读取的，先整体读入再解析快得多
+            version, cached_stamp, cached_hash, items, position_ids = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if version != CACHE_VERSION:
+        return None
+    if cached_stamp != stamp and cached_hash != source_hash:
+        return None
+    return items, position_ids, cached_hash
+
+
+def write_cache(cache_path, stamp, source_hash, catalog):
+    """原子写入启动缓存，写入失败（如目录只读）时忽略"""
+    payload = (CACHE_VERSION, stamp, source_hash, list(catalog.items()), catalog.position_ids)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(marshal.dumps(payload))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+
+
+def load_champions_data(filename="ai_champions_data.json", use_cache=True):
+    """加载英雄数据，优先使用编译好的启动缓存，源文件变化时自动重建"""
+    try:
+        st = os.stat(filename)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cache_path = cache_path_for(filename)
+        if use_cache:
+            cached = read_cache(cache_path, stamp)
+            if cached:
+                return ChampionCatalog(cached[0], cached[1])
+
+        with open(filename, 'rb') as f:
+            raw = f.read()
+        source_hash = hashlib.sha256(raw).hexdigest()
+        if use_cache:
+            # 内容未变只是修改时间变了：沿用缓存，只更新其中的修改时间
+            cached = read_cache(cache_path, None, source_hash)
+            if cached:
+                catalog = ChampionCatalog(cached[0], cached[1])
+                write_cache(cache_path, stamp, source_hash, catalog)
+                return catalog
+
+        data = json.loads(raw.decode('utf-8'))
+        catalog = ChampionCatalog((k, v) for k, v in data.items() if v.get('enable', 1) == 1)
+        if use_cache:
+            write_cache(cache_path, stamp, source_hash, catalog)
+        return catalog
+    except FileNotFoundError:
+        print(f"❌ 文件 {filename} 不存在")
+        return None
+    except Exception as e:
+        print(f"❌ 加载文件时出错: {e}")
+        return None
+
+
+def get_champions_by_position(champions_data, position):
+    """根据位置筛选英雄"""
+    catalog = as_catalog(champions_data)
+    return {str(champ_id): catalog.by_id[champ_id] for champ_id in catalog.position_ids.get(position, ())}
+
+
+def select_random_team(champions_data, rng=random):
+    """为五个位置随机选择英雄"""
+    catalog = as_catalog(champions_data)
+    selected_team = {}
+    used_ids = set()
+
+    for position in POSITIONS:
+        champ_id = catalog.sample(position, used_ids, rng)
+        if champ_id is None:
+            print(f"❌ 没有找到适合 {position} 位置的英雄")
+            continue
+        used_ids.add(champ_id)
+        selected_team[position] = catalog.team_member(champ_id, position)
+
+    return selected_team
+
+
+def _import_numpy():
+    """NumPy为可选依赖且导入较慢，只在批量生成阵容时导入"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def iter_lineup_batches(champions_data, count, seed=None, team_ids=("100", "200"), exclude=(),
+                        weights=None, batch_size=8192, max_rounds=1000):
+    """批量生成阵容，每批产出一个(批大小, 队伍数*5)的英雄ID二维数组
+
+    列按team_ids依次排列，每个队伍内按POSITIONS顺序。同一阵容内所有位置的英雄互不重复；
+    exclude为不参与的英雄ID，weights为{英雄ID: 权重}（缺省为1）。
+    给定seed时结果可复现。需要NumPy；没有NumPy时产出的是嵌套列表。
+    """
+    catalog = as_catalog(champions_data)
+    exclude = {int(champ_id) for champ_id in exclude}
+    weights = {int(champ_id): weight for champ_id, weight in (weights or {}).items()}
+    slots = []
+    for position in POSITIONS:
+        ids = [champ_id for champ_id in catalog.position_ids.get(position, ()) if champ_id not in exclude]
+        slot_weights = [float(weights.get(champ_id, 1)) for champ_id in ids]
+        if not ids or sum(slot_weights) <= 0:
+            raise ValueError(f"没有可用于 {position} 位置的英雄")
+        slots.append((ids, slot_weights))
+    slots = slots * len(team_ids)
+
+    np = _import_numpy()
+    if np is None:
+        yield from _iter_lineup_batches_python(slots, count, seed, batch_size, max_rounds)
+        return
+
+    rng = np.random.default_rng(seed)
+    slot_ids = [np.asarray(ids, dtype=np.int32) for ids, _ in slots]
+    # 按累积权重二分查找抽样
+    slot_cdfs = [np.cumsum(w) / np.sum(w) for _, w in slots]
+
+    def draw(rows):
+        columns = [ids[np.minimum(np.searchsorted(cdf, rng.random(rows), side='right'), len(ids) - 1)]
+                   for ids, cdf in zip(slot_ids, slot_cdfs)]
+        return np.stack(columns, axis=1)
+
+    remaining = count
+    while remaining > 0:
+        # 每批都按完整批大小抽样，保证同一seed下前N个阵容与总数无关
+        batch = draw(batch_size)
+        # 有重复英雄的行整行重抽（拒绝采样），结果等价于在“无重复”条件下按权重抽样
+        for _ in range(max_rounds):
+            sorted_batch = np.sort(batch, axis=1)
+            duplicated = np.flatnonzero((sorted_batch[:, 1:] == sorted_batch[:, :-1]).any(axis=1))
+            if duplicated.size == 0:
+                break
+            batch[duplicated] = draw(duplicated.size)
+        else:
+            raise ValueError("可用英雄太少，无法生成不重复的阵容")
+        rows = min(batch_size, remaining)
+        remaining -= rows
+        yield batch[:rows]
+
+
+def _iter_lineup_batches_python(slots, count, seed, batch_size, max_rounds):
+    rng = random.Random(seed)
+    remaining = count
+    while remaining > 0:
+        rows = min(batch_size, remaining)
+        batch = []
+        for _ in range(rows):
+            for _ in range(max_rounds):
+                row = [rng.choices(ids, weights=w)[0] for ids, w in slots]
+                if len(set(row)) == len(row):
+                    break
+            else:
+                raise ValueError("可用英雄太少，无法生成不重复的阵容")
+            batch.append(row)
+        remaining -= rows
+        yield batch
+
+
+def sample_lineups(champions_data, count, seed=None, team_ids=("100", "200"), **kwargs):
+    """逐个产出阵容{队伍ID: {位置: 英雄ID}}，按需生成，适合提前生成大量练习阵容"""
+    for batch in iter_lineup_batches(champions_data, count, seed, team_ids, **kwargs):
+        for row in batch.tolist() if hasattr(batch, 'tolist') else batch:
+            yield {team_id: dict(zip(POSITIONS, row[i * len(POSITIONS):(i + 1) * len(POSITIONS)]))
+                   for i, team_id in enumerate(team_ids)}
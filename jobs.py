@@ -0,0 +1,257 @@
+import itertools
+import threading
+import time
+
+from lcu import CancelToken, LobbyBuilder
+from metrics import metrics
+
+QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED = "queued", "running", "succeeded", "failed", "cancelled"
+STATUS_NAMES = {QUEUED: "排队中", RUNNING: "执行中", SUCCEEDED: "已完成", FAILED: "失败", CANCELLED: "已取消"}
+
+
+class LobbyJob:
+    """一个建房任务
+
+    team为队伍字典，或在开始执行时才调用的函数（如每次随机一个新队伍）；
+    port为目标客户端的端口，None表示第一个客户端。priority越大越先执行。
+    """
+    _ids = itertools.count(1)
+
+    def __init__(self, room_name, room_password, team, port=None, priority=0,
+                 team_id="200", difficulty="RSINTERMEDIATE"):
+        self.id = next(self._ids)
+        self.room_name = room_name
+        self.room_password = room_password
+        self.team = team
+        self.port = str(port) if port is not None else None
+        self.priority = priority
+        self.team_id = team_id
+        self.difficulty = difficulty
+        self.status = QUEUED
+        self.message = ""
+        self.progress = ""  # 最近一条进度信息
+        self.phase = None  # 当前所处的建房阶段
+        self.bots = {}  # 各位置人机的添加结果 {位置: 'added'或'failed'}
+        self.timings = {}
+        self.submitted = time.monotonic()
+        self.started = None
+        self.finished = None
+        self.builder = None
+        self.cancel_token = CancelToken()
+
+    @property
+    def done(self):
+        return self.status in (SUCCEEDED, FAILED, CANCELLED)
+
+    def __repr__(self):
+        return f"<LobbyJob #{self.id} {self.status} port={self.port} room={self.room_name!r}>"
+
+
+class LobbyJobScheduler:
+    """建房任务队列：固定数量的常驻工作线程按优先级取任务
+
+    同一客户端同一时间只执行一个任务（房间只有一个），不同客户端的任务并行执行；
+    客户端由LCUClientRegistry提供，任务之间复用同一个已建立连接的LCUClient。
+    on_update(job)在任务状态或进度变化时于工作线程中调用，调用可能很频繁，界面需自行合并刷新。
+    """
+
+    def __init__(self, registry, workers=4, on_update=None, history=100):
+        self.registry = registry
+        self.on_update = on_update or (lambda job: None)
+        self.history = history
+        self._condition = threading.Condition()
+        self._queue = []  # 等待中的任务，取任务时按(优先级, 提交顺序)挑选
+        self._running = {}  # {端口: 任务}
+        self._finished = []  # 最近完成的任务
+        self._completed_count = 0
+        self._failed_count = 0
+        self._started_at = time.monotonic()
+        self._stopping = False
+        self._refreshing = False  # 是否有工作线程正在重新查找客户端
+        self._threads = [threading.Thread(target=self._worker, name=f"lobby-job-{i}", daemon=True)
+                         for i in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, job):
+        with self._condition:
+            if self._stopping:
+                raise RuntimeError("任务队列已关闭")
+            self._queue.append(job)
+            self._condition.notify_all()
+        self.on_update(job)
+        return job
+
+    def cancel(self, job_id):
+        """取消排队中的任务，或中止执行中的任务"""
+        with self._condition:
+            for job in self._queue:
+                if job.id == job_id:
+                    self._queue.remove(job)
+                    break
+            else:
+                job = next((job for job in self._running.values() if job.id == job_id), None)
+                if job is not None:
+                    job.cancel_token.cancel()
+                return job is not None
+            self._finish(job, CANCELLED, "操作已取消")
+        self.on_update(job)
+        return True
+
+    def jobs(self):
+        """排队中、执行中和最近完成的任务"""
+        with self._condition:
+            return list(self._queue) + list(self._running.values()) + list(self._finished)
+
+    def stats(self):
+        """队列深度和吞吐量"""
+        with self._condition:
+            elapsed = time.monotonic() - self._started_at
+            durations = [job.finished - job.started for job in self._finished if job.started is not None]
+            return {
+                "queued": len(self._queue),
+                "running": len(self._running),
+                "completed": self._completed_count,
+                "failed": self._failed_count,
+                "throughput_per_min": self._completed_count / elapsed * 60 if elapsed > 0 else 0.0,
+                "avg_seconds": sum(durations) / len(durations) if durations else None,
+            }
+
+    def wait(self, timeout=None):
+        """等待队列清空且没有执行中的任务，超时返回False"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._queue or self._running:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def shutdown(self, wait=True):
+        """取消排队中的任务并中止执行中的任务"""
+        with self._condition:
+            self._stopping = True
+            cancelled, self._queue = self._queue, []
+            for job in cancelled:
+                self._finish(job, CANCELLED, "操作已取消")
+            for job in self._running.values():
+                job.cancel_token.cancel()
+            self._condition.notify_all()
+        for job in cancelled:
+            self.on_update(job)
+        if wait:
+            for thread in self._threads:
+                thread.join(1)
+
+    def _next_job(self):
+        """在锁内调用：选出目标客户端已知且空闲的最高优先级任务，返回(任务, 客户端)
+
+        返回的客户端已被acquire，执行期间即使客户端列表刷新也不会被关闭，任务结束后需release。
+        """
+        while True:
+            candidates = []
+            for job in self._queue:
+                client = self._client_for(job)
+                if client is not None and client.port not in self._running:
+                    candidates.append((job, client))
+            if not candidates:
+                return None, None
+            job, client = max(candidates, key=lambda candidate: (candidate[0].priority, -candidate[0].id))
+            # 选出后客户端可能刚被刷新替换，此时按新的客户端列表重新挑选
+            if self.registry.acquire(client):
+                self._queue.remove(job)
+                return job, client
+
+    def _client_for(self, job):
+        if job.port:
+            return self.registry.get(job.port)
+        clients = self.registry.clients()
+        return clients[0] if clients else None
+
+    def _unknown_client_jobs(self):
+        """在锁内调用：目标客户端尚未发现的排队任务"""
+        return [job for job in self._queue if self._client_for(job) is None]
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                job = client = None
+                refresh = False
+                while not self._stopping:
+                    job, client = self._next_job()
+                    if job is not None:
+                        break
+                    # 有任务的客户端还未发现时由一个工作线程在锁外重新查找，其余线程继续等待
+                    if not self._refreshing and self._unknown_client_jobs():
+                        self._refreshing = refresh = True
+                        break
+                    self._condition.wait()
+                else:
+                    return
+                if job is not None:
+                    # 先确定客户端再占用，同一客户端同一时间只执行一个任务
+                    job.port = client.port
+                    job.status, job.started = RUNNING, time.monotonic()
+                    self._running[job.port] = job
+            if refresh:
+                self._refresh_clients()
+                continue
+            self.on_update(job)
+            try:
+                self._run(job, client)
+            finally:
+                self.registry.release(client)
+                with self._condition:
+                    self._running.pop(job.port, None)
+                    self._condition.notify_all()
+            self.on_update(job)
+
+    def _refresh_clients(self):
+        """新的客户端或尚未发现任何客户端时重新查找一次，仍找不到目标客户端的任务直接失败"""
+        try:
+            self.registry.refresh()
+        except Exception as e:
+            print(f"查找客户端失败: {e}")
+        with self._condition:
+            self._refreshing = False
+            failed = self._unknown_client_jobs()
+            for job in failed:
+                self._queue.remove(job)
+                self._finish(job, FAILED, "未检测到英雄联盟客户端" if not job.port else f"未找到端口为 {job.port} 的客户端")
+            self._condition.notify_all()
+        for job in failed:
+            self.on_update(job)
+
+    def _run(self, job, client):
+        try:
+            team = job.team() if callable(job.team) else job.team
+        except Exception as e:
+            with self._condition:
+                self._finish(job, FAILED, f"生成队伍失败: {e}")
+            return
+
+        def progress(event):
+            job.progress, job.phase = str(event), event.phase
+            if event.position:
+                job.bots[event.position] = event.outcome
+            self.on_update(job)
+
+        job.builder = LobbyBuilder(client, job.room_name, job.room_password, team, team_id=job.team_id,
+                                   difficulty=job.difficulty, progress=progress, cancel_token=job.cancel_token)
+        success, message = job.builder.run()
+        job.timings = job.builder.timings
+        with self._condition:
+            status = SUCCEEDED if success else (CANCELLED if job.cancel_token.cancelled else FAILED)
+            self._finish(job, status, message)
+
+    def _finish(self, job, status, message):
+        """在锁内调用"""
+        job.status, job.message, job.finished = status, message, time.monotonic()
+        if status == SUCCEEDED:
+            self._completed_count += 1
+        elif status == FAILED:
+            self._failed_count += 1
+        self._finished.append(job)
+        del self._finished[:-self.history]
+        metrics.inc("lobby_jobs_total", status=status)
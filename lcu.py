@@ -0,0 +1,1262 @@
+import base64
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import random
+import re
+import ssl
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# 禁用SSL警告
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InsecureRequestWarning
+
+from metrics import metrics as shared_metrics
+
+urllib3.disable_warnings(InsecureRequestWarning)
+
+# websocket-client为可选依赖，缺失时房间就绪检测退化为轮询
+try:
+    import websocket
+except ImportError:
+    websocket = None
+
+
+def _encode_auth_token(password):
+    return base64.b64encode(f"riot:{password}".encode()).decode()
+
+
+class LCUCredentialProvider:
+    """LCU连接凭证缓存
+
+    优先读取客户端安装目录下的lockfile，之后每次查询只需stat()一次；
+    只有lockfile变化、连接被拒绝或返回401时才重新查找，尽量不启动wmic进程。
+    """
+    PROCESS_NAME = 'LeagueClientUx'
+    DEFAULT_LOCKFILES = ['C:/Riot Games/League of Legends/lockfile']
+    LOCKFILE_ENV = 'LCU_LOCKFILE'  # 环境变量指定的lockfile优先于默认位置（如连接mock_lcu.py）
+    ALL_INSTANCES_TTL = 5  # 多开时扫描进程较慢，结果缓存几秒
+
+    def __init__(self, lockfile_paths=None, proc_root='/proc'):
+        if lockfile_paths is None:
+            lockfile_paths = self.DEFAULT_LOCKFILES
+            if os.environ.get(self.LOCKFILE_ENV):
+                lockfile_paths = [os.environ[self.LOCKFILE_ENV]] + lockfile_paths
+        self.lockfile_paths = list(lockfile_paths)
+        self.proc_root = proc_root
+        self._lock = threading.Lock()
+        self._credentials = None
+        self._lockfile = None  # 当前凭证来自的lockfile
+        self._stamp = None  # lockfile的(修改时间, 大小)
+        self._rejected_stamp = None  # 已确认失效的lockfile版本，客户端崩溃时lockfile可能残留
+        self._install_lockfile = None  # 从进程命令行得知的安装目录下的lockfile
+        self._all_instances = None  # (扫描时刻, [(端口, 凭证)])
+        self._pinned = None  # 回放录制的请求时使用的固定实例
+
+    def use_lockfile(self, path):
+        """优先读取path处的lockfile"""
+        with self._lock:
+            self.lockfile_paths.insert(0, path)
+            self._credentials = None
+            self._all_instances = None
+
+    def pin(self, instances):
+        """固定返回这些[(port, auth_token)]，不再查找真实客户端；None恢复正常查找"""
+        with self._lock:
+            self._pinned = list(instances) if instances is not None else None
+
+    def get(self):
+        """返回(port, auth_token)，找不到客户端时返回(None, None)"""
+        with self._lock:
+            if self._pinned is not None:
+                return self._pinned[0] if self._pinned else (None, None)
+            if self._credentials:
+                if self._lockfile is None or self._stat(self._lockfile) == self._stamp:
+                    return self._credentials
+                self._credentials = None
+
+            self._credentials = self._read_lockfiles()
+            # 已知lockfile所在位置时lockfile不存在即说明客户端未运行，无需再扫描进程；
+            # 被拒绝的lockfile仍在时无法判断客户端是否还在（可能是崩溃残留），才扫描进程确认
+            if not self._credentials and (self._rejected_stamp is not None or not self._knows_lockfile_location()):
+                self._credentials = self._scan_processes()
+            return self._credentials or (None, None)
+
+    def get_all(self):
+        """返回所有正在运行的客户端实例的[(port, auth_token)]，按端口去重
+
+        同一安装目录下多开时lockfile只记录其中一个，所以以进程命令行为准；
+        扫描不到进程（如权限不足）时退回get()的结果。
+        """
+        with self._lock:
+            if self._pinned is not None:
+                return list(self._pinned)
+            if self._all_instances and time.monotonic() - self._all_instances[0] < self.ALL_INSTANCES_TTL:
+                return list(self._all_instances[1])
+            instances = {}
+            for command_line in self._command_lines():
+                port_match = re.search(r'--app-port=(\d+)', command_line)
+                token_match = re.search(r'--remoting-auth-token=([\w\-]+)', command_line)
+                if port_match and token_match:
+                    instances.setdefault(port_match.group(1), _encode_auth_token(token_match.group(1)))
+            result = sorted(instances.items(), key=lambda item: int(item[0]))
+        if not result:
+            port, token = self.get()
+            result = [(port, token)] if port and token else []
+        with self._lock:
+            self._all_instances = (time.monotonic(), result)
+        return list(result)
+
+    def invalidate(self):
+        """连接被拒绝或认证失败时调用，下次get()会重新查找"""
+        with self._lock:
+            self._all_instances = None
+            if self._lockfile is not None:
+                self._rejected_stamp = (self._lockfile, self._stamp)
+            self._credentials = None
+            self._lockfile = None
+            self._stamp = None
+
+    @staticmethod
+    def _stat(path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _knows_lockfile_location(self):
+        """已从进程命令行得知安装目录，或配置的lockfile所在目录存在（客户端装在默认位置）"""
+        if self._install_lockfile is not None:
+            return True
+        return any(os.path.isdir(os.path.dirname(path)) for path in self.lockfile_paths)
+
+    def _read_lockfiles(self):
+        if self._rejected_stamp is not None and self._stat(self._rejected_stamp[0]) != self._rejected_stamp[1]:
+            self._rejected_stamp = None  # 被拒绝的lockfile已删除或被重写，不再跳过
+        # 已知安装目录时只需stat()这一个lockfile
+        paths = [self._install_lockfile] if self._install_lockfile is not None else self.lockfile_paths
+        for path in paths:
+            stamp = self._stat(path)
+            if stamp is None or (path, stamp) == self._rejected_stamp:
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    # 格式: 进程名:pid:端口:密码:协议
+                    _, _, port, password, _ = f.read().strip().split(':')
+            except (OSError, ValueError):
+                continue
+            self._lockfile, self._stamp = path, stamp
+            return port, _encode_auth_token(password)
+        return None
+
+    def _scan_processes(self):
+        """从进程命令行中查找凭证，并记住安装目录以便之后改读lockfile"""
+        command_line = '\n'.join(self._command_lines())
+        if not command_line:
+            return None
+
+        port_match = re.search(r'--app-port=(\d+)', command_line)
+        token_match = re.search(r'--remoting-auth-token=([\w\-]+)', command_line)
+        install_match = re.search(r'--install-directory=([^"\0\r\n]+)', command_line)
+        if install_match:
+            # 有lockfile时以它为准，之后轮询只需stat()；读不到时仍按命令行查找
+            self._install_lockfile = os.path.join(install_match.group(1).strip(), 'lockfile')
+            credentials = self._read_lockfiles()
+            if credentials:
+                return credentials
+            if self._stat(self._install_lockfile) is None:
+                self._install_lockfile = None  # 该安装目录下没有lockfile
+
+        if port_match and token_match:
+            self._lockfile = self._stamp = None
+            return port_match.group(1), _encode_auth_token(token_match.group(1))
+        return None
+
+    def _command_lines(self):
+        """每个客户端进程一条命令行"""
+        return self._read_proc_command_lines() if os.path.isdir(self.proc_root) else self._read_wmic_command_lines()
+
+    def _read_proc_command_lines(self):
+        """Linux下扫描/proc，cmdline中参数以\\0分隔"""
+        command_lines = []
+        for pid in os.listdir(self.proc_root):
+            if not pid.isdigit():
+                continue
+            try:
+                with open(os.path.join(self.proc_root, pid, 'cmdline'), 'rb') as f:
+                    command_line = f.read().decode('utf-8', errors='ignore')
+            except OSError:
+                continue
+            executable = os.path.basename(command_line.split('\0', 1)[0].replace('\\', '/'))
+            if executable.startswith(self.PROCESS_NAME):
+                command_lines.append(command_line)
+        return command_lines
+
+    def _read_wmic_command_lines(self):
+        try:
+            output = subprocess.check_output(
+                f'wmic process where "name=\'{self.PROCESS_NAME}.exe\'" get commandline',
+                shell=True
+            ).decode('gbk', errors='ignore')
+        except subprocess.CalledProcessError:
+            print("❌ 请确保League客户端正在运行")
+            return []
+        except Exception as e:
+            print(f"❌ 获取凭证时发生错误: {e}")
+            return []
+        # 第一行是表头，之后每个进程一行
+        return [line for line in output.splitlines() if '--app-port' in line]
+
+
+credential_provider = LCUCredentialProvider()
+
+
+def get_lcu_credentials():
+    """获取LCU连接凭证"""
+    return credential_provider.get()
+
+
+class CircuitOpenError(Exception):
+    """熔断期间直接拒绝请求，不再等待超时"""
+
+
+class OperationCancelled(Exception):
+    """操作被取消或超过截止时间"""
+
+
+class CancelToken:
+    """协作式取消令牌
+
+    cancel()立即唤醒所有在该令牌上的等待（on_cancel登记的回调在调用cancel的线程中执行）；
+    timeout为截止时间（秒），到期后视为已取消。子令牌随父令牌一起取消，可以有更早的截止时间。
+    """
+
+    def __init__(self, parent=None, timeout=None, reason="操作已取消"):
+        self.reason = reason
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+        if parent is not None:
+            if parent.deadline is not None and (self.deadline is None or parent.deadline < self.deadline):
+                self.deadline, self.reason = parent.deadline, parent.reason
+            self._unlink_parent = parent.on_cancel(lambda: self.cancel(parent.reason))
+        else:
+            self._unlink_parent = lambda: None
+
+    def child(self, timeout=None, reason=None):
+        return CancelToken(self, timeout, reason or self.reason)
+
+    def cancel(self, reason=None):
+        with self._lock:
+            if self._event.is_set():
+                return
+            if reason:
+                self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def on_cancel(self, callback):
+        """登记取消回调，返回注销函数；已取消时立即调用"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._discard(callback)
+        callback()
+        return lambda: None
+
+    def _discard(self, callback):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def release(self):
+        """不再需要的子令牌从父令牌上解除登记"""
+        self._unlink_parent()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set() or (self.deadline is not None and time.monotonic() >= self.deadline)
+
+    def remaining(self, timeout=None):
+        """距截止时间的秒数与timeout中较小的一个，都没有时返回None"""
+        if self.deadline is None:
+            return timeout
+        remaining = max(0.0, self.deadline - time.monotonic())
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def raise_if_cancelled(self):
+        if self.cancelled:
+            raise OperationCancelled(self.reason)
+
+    def sleep(self, seconds):
+        """可被取消立即打断的等待，取消或到期时抛出OperationCancelled"""
+        self._event.wait(self.remaining(seconds))
+        self.raise_if_cancelled()
+
+    def result(self, future):
+        """等待future完成并返回结果；先被取消或到期时不再等待，抛出OperationCancelled"""
+        done = threading.Event()
+        future.add_done_callback(lambda f: done.set())
+        unregister = self.on_cancel(done.set)
+        try:
+            done.wait(self.remaining())
+        finally:
+            unregister()
+        if not future.done() or future.cancelled():
+            self.raise_if_cancelled()
+            raise OperationCancelled(self.reason)
+        return future.result()
+
+
+# 当前线程（上下文）所属任务的取消令牌，LCU请求和等待都会遵守它
+current_cancel_token = contextvars.ContextVar("current_cancel_token", default=None)
+
+
+@contextlib.contextmanager
+def cancel_scope(token):
+    """在with块内把token设为当前取消令牌"""
+    reset = current_cancel_token.set(token)
+    try:
+        yield token
+    finally:
+        current_cancel_token.reset(reset)
+
+
+class ResiliencePolicy:
+    """LCU请求的超时、重试和熔断策略
+
+    LCU在本机，连接超时可以很短；读超时按接口区分。GET/DELETE在连接失败或5xx时
+    带随机抖动重试。连续失败达到阈值后熔断，期间请求立即失败，冷却后再放行请求探测。
+    """
+    IDEMPOTENT_METHODS = frozenset(('GET', 'DELETE'))
+    RETRY_STATUS = frozenset((500, 502, 503, 504))
+    # (方法, 接口前缀, 读超时秒数)，按顺序取第一个匹配的
+    READ_TIMEOUTS = (
+        ('GET', '/lol-gameflow/', 1),
+        ('GET', '/lol-lobby/', 1.5),
+        ('POST', '/lol-lobby/v1/lobby/custom/bots', 2),
+        ('POST', '/lol-lobby/v2/lobby/custom/bots', 2),
+        ('POST', '/lol-lobby/v2/lobby', 4),  # 创建房间在客户端侧较慢
+    )
+
+    def __init__(self, connect_timeout=0.5, read_timeout=2, read_timeouts=None, max_retries=2,
+                 backoff=0.05, max_backoff=0.5, failure_threshold=3, reset_timeout=2.0, rng=None):
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.read_timeouts = self.READ_TIMEOUTS if read_timeouts is None else tuple(read_timeouts)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._failures = 0  # 连续的连接失败次数
+        self._opened_at = None  # 熔断开始的时刻，None表示未熔断
+
+    def timeout(self, method, endpoint):
+        """返回(连接超时, 读超时)"""
+        for rule_method, prefix, seconds in self.read_timeouts:
+            if method == rule_method and endpoint.startswith(prefix):
+                return self.connect_timeout, seconds
+        return self.connect_timeout, self.read_timeout
+
+    def should_retry(self, method, attempt, status=None):
+        """第attempt次（从0开始）请求失败后是否重试，status为None表示连接失败"""
+        if method not in self.IDEMPOTENT_METHODS or attempt >= self.max_retries:
+            return False
+        return status is None or status in self.RETRY_STATUS
+
+    def backoff_delay(self, attempt):
+        # 全抖动的指数退避，避免并发的人机请求同时重试
+        return self.rng.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def before_request(self):
+        """熔断期间抛出CircuitOpenError"""
+        with self._lock:
+            if self._opened_at is not None and time.monotonic() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError(f"客户端无响应，{self.reset_timeout}秒内不再发送请求")
+
+    def record_success(self):
+        """收到任何HTTP响应都说明客户端可达"""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            # 冷却后的探测请求也失败时重新计时
+            if self._failures >= self.failure_threshold or self._opened_at is not None:
+                if self._opened_at is None:
+                    print(f"❌ 客户端连续{self._failures}次无响应，暂停请求{self.reset_timeout}秒")
+                    shared_metrics.inc("lcu_circuit_open_total")
+                self._opened_at = time.monotonic()
+
+    @property
+    def is_open(self):
+        return self._opened_at is not None
+
+
+class LCUTransport:
+    """LCU HTTPS传输层，整个客户端生命周期内复用同一个长连接池"""
+
+    def __init__(self, base_url, headers, pool_size=10, metrics=None, policy=None):
+        self.base_url = base_url
+        self.metrics = metrics or shared_metrics
+        self.policy = policy or ResiliencePolicy()
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        # LCU只有一个主机，一个连接池即可；pool_size决定可并发的长连接数
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        # 有取消令牌时请求在这里发出，调用方可以在取消时立即返回
+        self._io_pool = ThreadPoolExecutor(max_workers=pool_size * 2, thread_name_prefix="lcu-io")
+
+    def request(self, endpoint, method='GET', data=None, timeout=None):
+        """按策略发送请求，熔断期间抛出CircuitOpenError，当前任务被取消时抛出OperationCancelled"""
+        token = current_cancel_token.get()
+        timeout = timeout or self.policy.timeout(method, endpoint)
+        attempt = 0
+        while True:
+            if token is not None:
+                token.raise_if_cancelled()
+            self.policy.before_request()
+            try:
+                with self.metrics.timed_request(method, endpoint) as status:
+                    response = self._send(method, endpoint, data, timeout, token, status)
+                    status[0] = response.status_code
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.policy.record_failure()
+                # 读超时说明客户端卡住了，立即重试只会再等一次超时
+                if isinstance(e, requests.ReadTimeout) or not self.policy.should_retry(method, attempt):
+                    raise
+            else:
+                self.policy.record_success()
+                if not self.policy.should_retry(method, attempt, response.status_code):
+                    return response
+            self.metrics.inc("lcu_request_retries_total", method=method)
+            if token is not None:
+                token.sleep(self.policy.backoff_delay(attempt))
+            else:
+                time.sleep(self.policy.backoff_delay(attempt))
+            attempt += 1
+
+    def _send(self, method, endpoint, data, timeout, token, status):
+        # verify需逐次传入，Session级别的设置会被REQUESTS_CA_BUNDLE等环境变量覆盖
+        send = functools.partial(self.session.request, method, f"{self.base_url}{endpoint}", json=data,
+                                 verify=False)
+        if token is None:
+            return send(timeout=timeout)
+        # requests无法中断进行中的请求：取消时调用方不再等待，剩余的请求受截止时间限制的超时约束
+        timeout = tuple(max(0.01, token.remaining(seconds)) for seconds in timeout)
+        try:
+            return token.result(self._io_pool.submit(send, timeout=timeout))
+        except OperationCancelled:
+            status[0] = "cancelled"
+            raise
+
+    def open_websocket(self, timeout=1):
+        """连接LCU的WebSocket，websocket-client未安装时返回None"""
+        if websocket is None:
+            return None
+        return websocket.create_connection(
+            self.base_url.replace('https://', 'wss://', 1) + "/",
+            header=[f"Authorization: {self.session.headers['Authorization']}"],
+            subprotocols=["wamp"],
+            sslopt={"cert_reqs": ssl.CERT_NONE},
+            timeout=timeout
+        )
+
+    def close(self):
+        self._io_pool.shutdown(wait=False)
+        self.session.close()
+
+
+def custom_lobby_payload(map_id, mode, lobby_name, password):
+    """创建自定义房间的请求体"""
+    return {
+        "customGameLobby": {
+            "configuration": {
+                "gameMode": mode,
+                "gameMutator": "",
+                "gameServerRegion": "",
+                "mapId": map_id,
+                "mutators": {"id": 1},
+                "spectatorPolicy": "AllAllowed",
+                "teamSize": 5
+            },
+            "lobbyName": lobby_name,
+            "lobbyPassword": password
+        },
+        "isCustom": True
+    }
+
+
+class LobbySnapshotCache:
+    """房间快照的短期缓存，同一阶段内重复读取房间不再发请求
+
+    本客户端的修改操作会使缓存失效，房间事件会直接更新缓存。
+    失效前已发出的查询结果不会写入缓存，避免旧快照覆盖新状态。
+    """
+
+    def __init__(self, ttl=0.5):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._lobby = None
+        self._expires = 0.0  # 缓存过期时刻，0表示没有缓存
+        self._generation = 0  # 每次失效或更新时递增
+
+    def lookup(self):
+        """返回(是否命中, 房间快照, 代数)，未命中时用代数调用store写回"""
+        with self._lock:
+            if time.monotonic() < self._expires:
+                return True, self._lobby, self._generation
+            return False, None, self._generation
+
+    def store(self, lobby, generation):
+        with self._lock:
+            if generation == self._generation:
+                self._lobby, self._expires = lobby, time.monotonic() + self.ttl
+
+    def update(self, lobby):
+        """房间事件推送的快照比任何进行中的查询都新"""
+        with self._lock:
+            self._generation += 1
+            self._lobby, self._expires = lobby, time.monotonic() + self.ttl
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._lobby, self._expires = None, 0.0
+
+
+class BotOperationExecutor:
+    """人机增删的并发执行器：限制并发数，只重试失败的操作，并按提交顺序回报结果"""
+
+    def __init__(self, max_workers=5, max_attempts=2):
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lcu-bot")
+
+    def run(self, operations, on_result=None):
+        """执行[(key, func)]或[(key, func, verify)]列表，返回{key: 是否成功}
+
+        失败的操作会重试；非幂等的操作（如添加人机）应提供verify，失败后先调用它确认操作是否其实已经生效
+        （如请求超时但客户端已经处理），返回True时视为成功而不再重试，避免重复添加。
+        on_result(key, success)在每个操作得出最终结果时回调，
+        同一轮内严格按operations的顺序，失败的操作排在后面。
+        当前取消令牌被取消时立即抛出OperationCancelled，各操作在同一令牌下执行。
+        """
+        token = current_cancel_token.get()
+        results = {operation[0]: False for operation in operations}
+        pending = [(operation[0], operation[1], operation[2] if len(operation) > 2 else None)
+                   for operation in operations]
+
+        for attempt in range(1, self.max_attempts + 1):
+            if not pending:
+                break
+            if token is not None:
+                token.raise_if_cancelled()
+            # 按提交顺序取结果，总耗时约等于最慢的一个请求
+            submitted = [(key, func, verify, self._submit(func)) for key, func, verify in pending]
+            pending, failed = [], []
+            for key, func, verify, future in submitted:
+                results[key] = self._result(key, future, token)
+                if results[key]:
+                    if on_result:
+                        on_result(key, True)
+                else:
+                    failed.append((key, func, verify))
+
+            checks = [(key, self._submit(verify)) for key, _, verify in failed if verify is not None]
+            verified = {key for key, future in checks if self._result(key, future, token)}
+            for key, func, verify in failed:
+                if key in verified:
+                    results[key] = True
+                if results[key] or attempt == self.max_attempts:
+                    if on_result:
+                        on_result(key, results[key])
+                else:
+                    pending.append((key, func, verify))
+                    shared_metrics.inc("lcu_bot_retries_total")
+
+        return results
+
+    def _submit(self, func):
+        # 复制上下文，工作线程中的请求同样遵守当前取消令牌
+        return self._pool.submit(contextvars.copy_context().run, func)
+
+    @staticmethod
+    def _result(key, future, token):
+        try:
+            return bool(token.result(future) if token is not None else future.result())
+        except OperationCancelled:
+            raise
+        except Exception as e:
+            print(f"人机操作出错 {key}: {e}")
+            return False
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False)
+
+
+class LCUClient:
+    # 同时存在v1/v2两个版本的接口，按顺序尝试
+    API_VERSIONS = ('v1', 'v2')
+    # 创建传输层的函数(base_url, headers, pool_size=)，录制或回放请求时替换
+    transport_factory = LCUTransport
+
+    def __init__(self, port, token, max_concurrency=5, on_credentials_invalid=None, lobby_ttl=0.5):
+        self.port = port
+        self.base_url = f"https://127.0.0.1:{port}"
+        self.headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Authorization": f"Basic {token}"
+        }
+        # 连接池大小与并发数一致，保证并发请求都能复用长连接
+        self.transport = self.transport_factory(self.base_url, self.headers, pool_size=max_concurrency)
+        self.bot_executor = BotOperationExecutor(max_workers=max_concurrency)
+        self.lobby_cache = LobbySnapshotCache(lobby_ttl)
+        # 记住每个操作最近一次可用的接口版本，下次直接使用
+        self._api_versions = {}
+        # 本客户端最近创建的房间密码，房间接口不返回密码，复用房间时据此判断
+        self.lobby_password = None
+        # 连接被拒绝或认证失败时通知凭证缓存失效
+        self.on_credentials_invalid = on_credentials_invalid
+
+    def close(self):
+        self.bot_executor.shutdown()
+        self.transport.close()
+
+    def warm_up(self):
+        """并发发出轻量请求，提前建立连接池中的全部长连接，之后建房时不再等TLS握手"""
+        operations = [(i, self.get_gameflow_phase) for i in range(self.bot_executor.max_workers)]
+        return any(self.bot_executor.run(operations).values())
+
+    def get_gameflow_phase(self):
+        response = self._make_request('/lol-gameflow/v1/gameflow-phase')
+        return response.text.strip('"') if response and response.status_code == 200 else None
+
+    def get_game_version(self):
+        response = self._make_request('/lol-patch/v1/game-version')
+        return response.json() if response and response.status_code == 200 else None
+
+    def get_champion_summary(self):
+        """客户端自带的英雄概要列表（全部英雄，含id为-1的占位项）"""
+        response = self._make_request('/lol-game-data/assets/v1/champion-summary.json')
+        return response.json() if response and response.status_code == 200 else None
+
+    def get_available_bots(self):
+        """可以作为自定义人机的英雄ID集合，获取失败时返回None"""
+        response = self._make_request('/lol-lobby/v2/lobby/custom/available-bots')
+        if response and response.status_code == 200:
+            return {bot['id'] for bot in response.json() if bot.get('active', True)}
+        return None
+
+    def get_lobby(self, fresh=False):
+        """返回房间快照，不在房间中时返回None；fresh为True时跳过缓存（等待房间变化时使用）"""
+        hit, lobby, generation = self.lobby_cache.lookup()
+        if hit and not fresh:
+            return lobby
+        response = self._make_request('/lol-lobby/v2/lobby')
+        if response is None or response.status_code not in (200, 404):
+            return None  # 请求失败的结果不缓存
+        lobby = response.json() if response.status_code == 200 else None
+        self.lobby_cache.store(lobby, generation)
+        return lobby
+
+    def get_custom_bots(self):
+        return [m for m in (self.get_lobby() or {}).get('members', []) if m.get('isBot', False)]
+
+    def add_bot(self, bot_data):
+        try:
+            return self._make_versioned_request('add_bot', '/lol-lobby/{}/lobby/custom/bots',
+                                                'POST', bot_data, ok_codes=(200, 201, 204))
+        finally:
+            self.lobby_cache.invalidate()
+
+    def remove_bot(self, champion_id):
+        try:
+            return self._make_versioned_request('remove_bot', f'/lol-lobby/{{}}/lobby/custom/bots/{champion_id}',
+                                                'DELETE', ok_codes=(200, 204))
+        finally:
+            self.lobby_cache.invalidate()
+
+    def remove_bots(self, champion_ids):
+        operations = [(i, functools.partial(self.remove_bot, champion_id))
+                      for i, champion_id in enumerate(champion_ids) if champion_id]
+        return all(self.bot_executor.run(operations).values())
+
+    def clear_all_bots(self):
+        return self.remove_bots([get_bot_champion_id(bot) for bot in self.get_custom_bots()])
+
+    def create_custom_lobby(self, map_id=11, mode="CLASSIC", lobby_name="AI Game", password=""):
+        lobby_data = custom_lobby_payload(map_id, mode, lobby_name, password)
+        response = self._make_request('/lol-lobby/v2/lobby', 'POST', lobby_data)
+        self.lobby_cache.invalidate()
+        if response and response.status_code == 200:
+            self.lobby_password = password
+            return True
+        return False
+
+    def is_in_lobby(self):
+        return self.get_lobby() is not None
+
+    def _make_versioned_request(self, operation, endpoint_template, method, data=None, ok_codes=(200, 204)):
+        """优先使用上次成功的接口版本，只有该版本的接口不存在（404/405）时才回退到其它版本
+
+        其它失败（如500、超时）时请求可能已被处理，不在这里换版本重发，由调用方决定是否重试。
+        """
+        preferred = self._api_versions.get(operation, self.API_VERSIONS[0])
+        versions = [preferred] + [v for v in self.API_VERSIONS if v != preferred]
+        for version in versions:
+            if version != preferred:
+                shared_metrics.inc("lcu_api_version_fallbacks_total", operation=operation)
+            response = self._make_request(endpoint_template.format(version), method, data)
+            if response and response.status_code in ok_codes:
+                self._api_versions[operation] = version
+                return True
+            if response is None or response.status_code not in (404, 405):
+                break
+        return False
+
+    def _make_request(self, endpoint, method='GET', data=None):
+        try:
+            response = self.transport.request(endpoint, method, data)
+        except OperationCancelled:
+            raise  # 取消由任务自己处理，不视为客户端故障
+        except CircuitOpenError:
+            return None
+        except requests.ConnectionError as e:
+            print(f"请求错误 {endpoint}: {e}")
+            self._credentials_invalid()
+            return None
+        except Exception as e:
+            print(f"请求错误 {endpoint}: {e}")
+            return None
+        if response.status_code == 401:
+            self._credentials_invalid()
+        return response
+
+    def _credentials_invalid(self):
+        if self.on_credentials_invalid:
+            self.on_credentials_invalid()
+
+
+def get_bot_champion_id(member):
+    """取房间成员中人机的英雄ID（新版字段为botChampionId）"""
+    return member.get('botChampionId') or member.get('championId')
+
+
+class LobbyEventStream:
+    """订阅LCU WebSocket上的房间事件，维护最新的房间快照"""
+    EVENT_NAME = "OnJsonApiEvent_lol-lobby_v2_lobby"
+
+    def __init__(self, client):
+        self.client = client
+        self.condition = threading.Condition()
+        self.lobby = None
+        self.connected = False
+        self._ws = None
+
+    def start(self, timeout=1):
+        """建立连接并订阅，事件不可用时返回False"""
+        try:
+            self._ws = self.client.transport.open_websocket(timeout)
+            if self._ws is None:
+                return False
+            self._ws.send(json.dumps([5, self.EVENT_NAME]))
+            self._ws.settimeout(None)
+        except Exception as e:
+            print(f"订阅房间事件失败，改用轮询: {e}")
+            self._ws = None
+            return False
+
+        # 订阅之后再取一次快照，避免错过订阅前已发生的变化
+        lobby = self.client.get_lobby(fresh=True)
+        with self.condition:
+            self.lobby = lobby
+            self.connected = True
+        threading.Thread(target=self._run, daemon=True).start()
+        return True
+
+    def _run(self):
+        while True:
+            try:
+                message = self._ws.recv()
+            except Exception:
+                break
+            try:
+                payload = json.loads(message) if message else None
+            except ValueError:
+                continue
+            # WAMP事件格式: [8, 事件名, {"uri", "eventType", "data"}]
+            if not isinstance(payload, list) or len(payload) < 3 or payload[0] != 8:
+                continue
+            event = payload[2]
+            uri = event.get('uri')
+            with self.condition:
+                if uri == '/lol-lobby/v2/lobby':
+                    self.lobby = None if event.get('eventType') == 'Delete' else event.get('data')
+                elif uri == '/lol-lobby/v2/lobby/members' and self.lobby is not None:
+                    self.lobby = dict(self.lobby, members=event.get('data') or [])
+                else:
+                    continue
+                self.client.lobby_cache.update(self.lobby)
+                self.condition.notify_all()
+
+        with self.condition:
+            self.connected = False
+            self.condition.notify_all()
+
+    def forget_lobby(self):
+        """丢弃当前快照，之后只认收到的新事件（新建同名房间前调用，避免把旧房间当成新房间）"""
+        with self.condition:
+            self.lobby = None
+
+    def wake(self):
+        """唤醒等待房间事件的线程（取消时使用）"""
+        with self.condition:
+            self.condition.notify_all()
+
+    def stop(self):
+        if self._ws is not None:
+            try:
+                self._ws.close()
+            except Exception:
+                pass
+            self._ws = None
+
+
+class LobbyReadiness:
+    """房间就绪检测：优先等待LCU事件，事件不可用时退化为自适应短间隔轮询"""
+
+    def __init__(self, client, events=None, min_interval=0.05, max_interval=0.5, resync_interval=1.0):
+        self.client = client
+        self.events = events
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.resync_interval = resync_interval
+
+    def wait_for(self, predicate, timeout=10):
+        """等待房间快照满足predicate，满足时返回True，超时返回False；当前任务被取消时抛出OperationCancelled"""
+        token = current_cancel_token.get() or CancelToken()
+        deadline = time.monotonic() + timeout
+
+        if self.events is not None and self.events.connected:
+            next_resync = time.monotonic() + self.resync_interval
+            # 取消时立即唤醒，等待期间无需定时醒来检查
+            unregister = token.on_cancel(self.events.wake)
+            try:
+                while self.events.connected:
+                    with self.events.condition:
+                        if predicate(self.events.lobby):
+                            return True
+                        token.raise_if_cancelled()
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return False
+                        self.events.condition.wait(token.remaining(
+                            max(0.0, min(remaining, next_resync - time.monotonic()))))
+                    # 长时间没有匹配的事件时主动查询一次，防止漏掉事件
+                    if time.monotonic() >= next_resync:
+                        if predicate(self.client.get_lobby(fresh=True)):
+                            return True
+                        next_resync = time.monotonic() + self.resync_interval
+            finally:
+                unregister()
+
+        # 轮询间隔从很短开始逐步放大，客户端快时几乎没有额外等待
+        interval = self.min_interval
+        while True:
+            if predicate(self.client.get_lobby(fresh=True)):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            token.sleep(min(interval, remaining))
+            interval = min(interval * 1.5, self.max_interval)
+
+    def wait_for_custom_lobby(self, lobby_name=None, timeout=10):
+        def ready(lobby):
+            config = (lobby or {}).get('gameConfig') or {}
+            if not config.get('isCustom'):
+                return False
+            return lobby_name is None or config.get('customLobbyName', lobby_name) == lobby_name
+        return self.wait_for(ready, timeout)
+
+    def wait_for_bots(self, champion_ids, team_id=None, timeout=3):
+        """等待指定的人机全部出现在房间中"""
+        def ready(lobby):
+            present = {get_bot_champion_id(member) for member in (lobby or {}).get('members') or []
+                       if member.get('isBot') and (team_id is None or str(member.get('teamId')) == str(team_id))}
+            return set(champion_ids) <= present
+        return self.wait_for(ready, timeout)
+
+
+class LobbyPlan:
+    """房间调整计划：是否新建房间、需要移除的人机成员、需要添加和保留的人机"""
+
+    def __init__(self, create_lobby, removals, additions, kept):
+        self.create_lobby = create_lobby
+        self.removals = removals
+        self.additions = additions
+        self.kept = kept
+
+
+def plan_lobby_changes(desired_teams, lobby, lobby_name, map_id=11, mode="CLASSIC",
+                       difficulty="RSINTERMEDIATE", reuse_lobby=True):
+    """对比期望队伍与当前房间成员，计算最少的增删操作
+
+    desired_teams为{队伍ID: {位置: 英雄信息}}，英雄信息可带'difficulty'覆盖默认难度。
+    当前已是同名、同地图、同模式的自定义房间时不再新建房间。
+    只调整desired_teams中的队伍，其它队伍的人机保持不变。
+    """
+    config = (lobby or {}).get('gameConfig') or {}
+    create_lobby = not (reuse_lobby and config.get('isCustom')
+                        and config.get('customLobbyName') == lobby_name
+                        and config.get('mapId', map_id) == map_id
+                        and config.get('gameMode', mode) == mode)
+    # 新建房间后原有人机都会消失，无需移除
+    team_ids = {str(team_id) for team_id in desired_teams}
+    current_bots = [] if create_lobby else [m for m in lobby.get('members') or []
+                                            if m.get('isBot') and str(m.get('teamId')) in team_ids]
+
+    additions, kept = [], []
+    for team_id, team in desired_teams.items():
+        for position, champ_info in team.items():
+            wanted = {
+                'team_id': str(team_id),
+                'position': position.upper(),
+                'champion_id': int(champ_info['champion_id']),
+                'name': champ_info.get('name', ''),
+                'difficulty': champ_info.get('difficulty', difficulty).upper()
+            }
+            match = next((bot for bot in current_bots if _bot_matches(bot, wanted)), None)
+            if match is None:
+                additions.append(wanted)
+            else:
+                current_bots.remove(match)
+                kept.append(wanted)
+
+    return LobbyPlan(create_lobby, current_bots, additions, kept)
+
+
+def _bot_matches(member, wanted):
+    """判断房间中的人机是否与期望的英雄、队伍、位置和难度一致"""
+    if get_bot_champion_id(member) != wanted['champion_id'] or str(member.get('teamId')) != wanted['team_id']:
+        return False
+    # 部分客户端版本不返回位置或难度，缺失时视为一致
+    position = member.get('botPosition') or member.get('position')
+    if position and position.upper() != wanted['position']:
+        return False
+    bot_difficulty = member.get('botDifficulty')
+    return not bot_difficulty or bot_difficulty.upper() == wanted['difficulty']
+
+
+class ProgressEvent:
+    """建房过程中的结构化进度事件，str()为可读的进度信息
+
+    phase为所处阶段，position和outcome（'added'或'failed'）只在单个人机有结果时给出，
+    elapsed为从开始建房起经过的秒数。
+    """
+    __slots__ = ('message', 'phase', 'position', 'outcome', 'elapsed')
+
+    def __init__(self, message, phase=None, position=None, outcome=None, elapsed=0.0):
+        self.message = message
+        self.phase = phase
+        self.position = position
+        self.outcome = outcome
+        self.elapsed = elapsed
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return f"<ProgressEvent {self.phase} {self.message!r}>"
+
+
+class LobbyBuilder:
+    """创建房间并按计划增删人机的完整流程，不依赖Qt，界面和命令行共用
+
+    cancel_token被取消时进行中的请求和等待立即结束；每个阶段另有截止时间，超时即中止。
+    progress(event)以ProgressEvent回报进度，在执行建房的线程中调用。
+    """
+    # 各阶段的截止时间（秒），客户端卡住时不必等满每个请求的超时和重试
+    PHASE_DEADLINES = {'subscribe': 3, 'plan': 5, 'create': 8, 'wait_lobby': 12,
+                       'remove': 8, 'add': 10, 'wait_bots': 5}
+    # 添加人机失败后确认它是否其实已进入房间的等待时间（秒）
+    ADD_VERIFY_TIMEOUT = 0.5
+
+    def __init__(self, client, room_name, room_password, selected_team,
+                 team_id="200", difficulty="RSINTERMEDIATE", progress=None, cancel_token=None):
+        self.client = client
+        self.room_name = room_name
+        self.room_password = room_password
+        self.selected_team = selected_team
+        self.team_id = team_id
+        self.difficulty = difficulty
+        self.progress = progress or (lambda message: None)
+        self.cancel_token = cancel_token or CancelToken()
+        self.timings = {}  # 各阶段耗时（秒），按执行顺序记录
+        self._started = time.perf_counter()
+
+    def _report(self, message, phase=None, position=None, outcome=None):
+        self.progress(ProgressEvent(message, phase, position, outcome, time.perf_counter() - self._started))
+
+    @property
+    def abort(self):
+        """是否已被中止"""
+        return self.cancel_token.cancelled
+
+    @contextlib.contextmanager
+    def _phase(self, name):
+        token = self.cancel_token.child(self.PHASE_DEADLINES.get(name), reason=f"{name} 阶段超时")
+        start = time.perf_counter()
+        try:
+            with cancel_scope(token):
+                yield
+        finally:
+            token.release()
+            elapsed = time.perf_counter() - start
+            self.timings[name] = self.timings.get(name, 0) + elapsed
+            shared_metrics.observe_phase(name, elapsed)
+
+    def run(self):
+        """执行完整流程，返回(是否成功, 结果信息)"""
+        self._started = time.perf_counter()
+        # 订阅房间事件，用事件驱动的就绪检测代替固定等待
+        events = LobbyEventStream(self.client)
+        try:
+            self.cancel_token.raise_if_cancelled()
+            with self._phase('subscribe'):
+                events.start()
+            self.readiness = LobbyReadiness(self.client, events)
+            success, message = self._run()
+        except OperationCancelled as e:
+            success, message = False, str(e)
+        except Exception as e:
+            success, message = False, f"执行过程中发生错误: {str(e)}"
+        finally:
+            events.stop()
+        shared_metrics.inc("lobby_builds_total", result="success" if success else "failure")
+        return success, message
+
+    def _run(self):
+        self._report("正在检查当前房间...", 'plan')
+        self.cancel_token.raise_if_cancelled()
+
+        # 只执行与当前房间的差异部分，已在正确位置的人机保持不动；
+        # 房间接口不返回密码，不是本客户端创建的房间只有在不需要密码时才复用
+        if self.client.lobby_password is None:
+            reuse_lobby = not self.room_password
+        else:
+            reuse_lobby = self.client.lobby_password == self.room_password
+        with self._phase('plan'):
+            plan = plan_lobby_changes(
+                {self.team_id: self.selected_team}, self.client.get_lobby(), self.room_name,
+                difficulty=self.difficulty, reuse_lobby=reuse_lobby
+            )
+
+        if plan.create_lobby:
+            self._report("正在创建自定义房间...", 'create')
+            if self.readiness.events is not None:
+                self.readiness.events.forget_lobby()
+            with self._phase('create'):
+                created = self.client.create_custom_lobby(lobby_name=self.room_name, password=self.room_password)
+            if not created:
+                return False, "创建自定义房间失败！"
+
+            self._report("等待房间创建完成...", 'wait_lobby')
+            with self._phase('wait_lobby'):
+                ready = self.readiness.wait_for_custom_lobby(self.room_name)
+            if not ready:
+                return False, "未能成功进入自定义房间！"
+        else:
+            self._report("已在相同的自定义房间中，跳过创建", 'create')
+
+        if plan.removals:
+            self._report(f"正在移除 {len(plan.removals)} 个人机...", 'remove')
+            with self._phase('remove'):
+                self.client.remove_bots([get_bot_champion_id(bot) for bot in plan.removals])
+
+        results = {}
+        if plan.additions:
+            self._report("正在添加AI英雄...", 'add')
+            results = self.add_bots(plan.additions)
+
+        total = len(plan.kept) + len(plan.additions)
+        success_count = len(plan.kept) + sum(1 for result in results.values() if result['success'])
+        if success_count == total:
+            return True, f"🎉 成功添加{total}个AI英雄！"
+        return True, f"⚠️ 成功添加 {success_count}/{total} 个AI英雄"
+
+    def add_bots(self, additions):
+        """并发添加plan_lobby_changes给出的人机，结果按(队伍, 位置)记录"""
+        results = {}
+        operations = []
+        for bot in additions:
+            bot_data = {
+                "championId": bot['champion_id'],
+                "botDifficulty": bot['difficulty'],
+                "teamId": bot['team_id'],
+                "position": bot['position']
+            }
+            # 添加请求不是幂等的，失败后先确认人机是否其实已进入房间，不在时才重试
+            verify = functools.partial(self.readiness.wait_for_bots, [bot['champion_id']], bot['team_id'],
+                                       timeout=self.ADD_VERIFY_TIMEOUT)
+            operations.append(((bot['team_id'], bot['position']),
+                               functools.partial(self.client.add_bot, bot_data), verify))
+        bots = {(bot['team_id'], bot['position']): bot for bot in additions}
+
+        def report(key, success):
+            bot = bots[key]
+            results[key] = {
+                'success': success,
+                'champion': bot['name'],
+                'champion_id': bot['champion_id']
+            }
+            self._report(f"{'✅' if success else '❌'} 添加 {bot['position']}: {bot['name']}", 'add',
+                         bot['position'], 'added' if success else 'failed')
+
+        # 并发添加，结果按位置顺序回报
+        with self._phase('add'):
+            self.client.bot_executor.run(operations, on_result=report)
+
+        # 等到添加成功的人机都出现在房间里
+        with self._phase('wait_bots'):
+            for team_id in {team_id for team_id, _ in results}:
+                added = [result['champion_id'] for (tid, _), result in results.items()
+                         if tid == team_id and result['success']]
+                if added:
+                    self._report("等待英雄进入房间...", 'wait_bots')
+                    self.readiness.wait_for_bots(added, team_id)
+
+        return results
+
+    def stop(self):
+        """中止当前任务，进行中的请求和等待立即结束"""
+        self.cancel_token.cancel()
+
+
+class LCUClientRegistry:
+    """多开时按端口管理各客户端实例的LCUClient，客户端重启（凭证变化）或退出时替换或关闭"""
+
+    def __init__(self, provider=None, client_factory=None):
+        self.provider = provider or credential_provider
+        self.client_factory = client_factory or (
+            lambda port, token: LCUClient(port, token, on_credentials_invalid=self.provider.invalidate))
+        self._lock = threading.Lock()
+        self._clients = {}  # {端口: LCUClient}
+        self._leases = {}  # {LCUClient: 正在使用它的任务数}
+        self._retired = []  # 已被替换但仍有任务在用的客户端，任务结束后再关闭
+
+    def refresh(self, warm_up=False):
+        """重新发现客户端实例，返回按端口排序的[LCUClient]
+
+        warm_up为True时并行预热新发现的客户端，多开建房时各客户端都已有现成的长连接。
+        正被任务使用（acquire）的旧客户端不会立即关闭，而是在release时关闭。
+        """
+        instances = self.provider.get_all()
+        new_clients = []
+        with self._lock:
+            current = dict(instances)
+            for port in list(self._clients):
+                client = self._clients[port]
+                if current.get(port) != client.headers["Authorization"][len("Basic "):]:
+                    if self._leases.get(client):
+                        self._retired.append(client)
+                    else:
+                        client.close()
+                    del self._clients[port]
+            for port, token in instances:
+                if port not in self._clients:
+                    self._clients[port] = self.client_factory(port, token)
+                    new_clients.append(self._clients[port])
+            clients = [self._clients[port] for port, _ in instances]
+        if warm_up and new_clients:
+            with ThreadPoolExecutor(max_workers=len(new_clients), thread_name_prefix="lcu-warm") as pool:
+                list(pool.map(lambda client: client.warm_up(), new_clients))
+        return clients
+
+    def clients(self):
+        with self._lock:
+            return [self._clients[port] for port in sorted(self._clients, key=int)]
+
+    def get(self, port):
+        with self._lock:
+            return self._clients.get(str(port))
+
+    def acquire(self, client):
+        """标记客户端正在被任务使用，期间refresh不会关闭它；客户端已被替换或关闭时返回False"""
+        with self._lock:
+            if self._clients.get(client.port) is not client:
+                return False
+            self._leases[client] = self._leases.get(client, 0) + 1
+            return True
+
+    def release(self, client):
+        with self._lock:
+            self._leases[client] -= 1
+            if self._leases[client]:
+                return
+            del self._leases[client]
+            if client in self._retired:
+                self._retired.remove(client)
+                client.close()
+
+    def close(self):
+        with self._lock:
+            for client in list(self._clients.values()) + self._retired:
+                client.close()
+            self._clients.clear()
+            self._retired.clear()
+
+
+class MultiLobbyBuilder:
+    """在多个客户端上并行执行LobbyBuilder，总耗时约等于最慢的一个客户端"""
+
+    def __init__(self, clients, room_name, room_password, selected_team,
+                 team_id="200", difficulty="RSINTERMEDIATE", progress=None, on_result=None):
+        self.progress = progress or (lambda port, message: None)
+        self.on_result = on_result
+        self.builders = {
+            client.port: LobbyBuilder(client, room_name, room_password, selected_team, team_id=team_id,
+                                      difficulty=difficulty, progress=functools.partial(self.progress, client.port))
+            for client in clients
+        }
+
+    def run(self):
+        """返回{端口: (是否成功, 结果信息)}；每个客户端完成时调用on_result(端口, 是否成功, 结果信息)"""
+        results = {}
+        if not self.builders:
+            return results
+        # 每个客户端有独立的连接池和人机执行器，这里只需每个客户端一个线程
+        with ThreadPoolExecutor(max_workers=len(self.builders), thread_name_prefix="lcu-multi") as pool:
+            futures = {pool.submit(builder.run): port for port, builder in self.builders.items()}
+            for future in as_completed(futures):
+                port = futures[future]
+                results[port] = future.result()
+                if self.on_result:
+                    self.on_result(port, *results[port])
+        return results
+
+    def timings(self):
+        return {port: builder.timings for port, builder in self.builders.items()}
+
+    def stop(self):
+        for builder in self.builders.values():
+            builder.stop()
@@ -0,0 +1,217 @@
+import bisect
+import contextlib
+import json
+import os
+import re
+import threading
+import time
+
+
+class StartupProfiler:
+    """记录启动各阶段的耗时，用于发现启动变慢的问题"""
+
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self.phases = []  # [(阶段名, 耗时秒数)]
+        self.marks = []  # [(里程碑名, 距启动的秒数)]
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        phase_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - phase_start))
+
+    def mark(self, name):
+        self.marks.append((name, time.perf_counter() - self.start))
+
+    def report(self):
+        lines = ["⏱️ 启动耗时分析"]
+        lines += [f"  {name:<16} {seconds * 1000:8.1f} ms" for name, seconds in self.phases]
+        lines += [f"  @ {name:<14} {seconds * 1000:8.1f} ms" for name, seconds in self.marks]
+        return "\n".join(lines)
+
+
+# 延迟直方图的桶上界（秒），覆盖本地请求到慢速创建房间的范围
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# 接口路径中的数字参数（如人机英雄ID）归为同一个接口，避免标签数量无限增长
+_ID_SEGMENT = re.compile(r'/\d+(?=/|$)')
+
+
+def normalize_endpoint(endpoint):
+    return _ID_SEGMENT.sub('/{id}', endpoint.split('?', 1)[0])
+
+
+class Histogram:
+    """固定桶的直方图，observe只做一次二分查找和两次加法"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 最后一个是+Inf桶
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """按桶估算分位数，返回所在桶的上界（落在+Inf桶时返回None）"""
+        if not self.count:
+            return None
+        rank, seen = q * self.count, 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return None
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": {str(bound): count for bound, count in zip(self.buckets, self.counts)},
+            "inf": self.counts[-1],
+        }
+
+
+class MetricsRegistry:
+    """LCU请求延迟、建房阶段耗时、重试和错误计数，可导出为JSON或Prometheus文本"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = {}  # {(方法, 接口, 状态码): Histogram}，请求异常时状态码为"error"
+        self.phases = {}  # {阶段名: Histogram}
+        self.counters = {}  # {(指标名, 标签元组): 次数}
+        self.started = time.time()
+
+    def observe_request(self, method, endpoint, status, seconds):
+        key = (method, normalize_endpoint(endpoint), str(status))
+        with self._lock:
+            histogram = self.requests.get(key)
+            if histogram is None:
+                histogram = self.requests[key] = Histogram()
+            histogram.observe(seconds)
+
+    def observe_phase(self, name, seconds):
+        with self._lock:
+            histogram = self.phases.get(name)
+            if histogram is None:
+                histogram = self.phases[name] = Histogram()
+            histogram.observe(seconds)
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    @contextlib.contextmanager
+    def timed_request(self, method, endpoint):
+        """计时一次请求，调用方通过yield出的列表回填状态码"""
+        status = ["error"]
+        start = time.perf_counter()
+        try:
+            yield status
+        finally:
+            self.observe_request(method, endpoint, status[0], time.perf_counter() - start)
+
+    def reset(self):
+        with self._lock:
+            self.requests.clear()
+            self.phases.clear()
+            self.counters.clear()
+            self.started = time.time()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "started": self.started,
+                "timestamp": time.time(),
+                "requests": [
+                    {"method": method, "endpoint": endpoint, "status": status, **histogram.to_dict()}
+                    for (method, endpoint, status), histogram in sorted(self.requests.items())
+                ],
+                "phases": {name: histogram.to_dict() for name, histogram in self.phases.items()},
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(self.counters.items())
+                ],
+            }
+
+    def to_prometheus(self):
+        lines = []
+        with self._lock:
+            lines.append("# TYPE lcu_request_duration_seconds histogram")
+            for (method, endpoint, status), histogram in sorted(self.requests.items()):
+                labels = f'method="{method}",endpoint="{endpoint}",status="{status}"'
+                lines += _prometheus_histogram("lcu_request_duration_seconds", labels, histogram)
+            lines.append("# TYPE lobby_phase_duration_seconds histogram")
+            for name, histogram in self.phases.items():
+                lines += _prometheus_histogram("lobby_phase_duration_seconds", f'phase="{name}"', histogram)
+            for name in sorted({name for name, _ in self.counters}):
+                lines.append(f"# TYPE {name} counter")
+                for (counter_name, labels), value in sorted(self.counters.items()):
+                    if counter_name == name:
+                        label_text = ",".join(f'{key}="{val}"' for key, val in labels)
+                        lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """按扩展名导出快照：.json为JSON，其它为Prometheus文本格式"""
+        if path.endswith('.json'):
+            text = json.dumps(self.snapshot(), ensure_ascii=False, indent=2) + "\n"
+        else:
+            text = self.to_prometheus()
+        # 先写临时文件再替换，避免采集方读到写了一半的文件
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def summary(self):
+        """界面统计页和命令行使用的可读摘要"""
+        lines = ["接口延迟（按状态码）:"]
+        with self._lock:
+            totals = {}
+            for (method, endpoint, status), histogram in sorted(self.requests.items()):
+                lines.append(f"  {method:<6} {endpoint:<40} {status:>5} 次数 {histogram.count:>5}  "
+                             f"平均 {histogram.sum / histogram.count * 1000:7.1f} ms  "
+                             f"p90≤{_format_bound(histogram.quantile(0.9))}")
+                total, errors = totals.get((method, endpoint), (0, 0))
+                failed = histogram.count if not status.startswith('2') else 0
+                totals[(method, endpoint)] = (total + histogram.count, errors + failed)
+            if totals:
+                lines.append("错误率:")
+                lines += [f"  {method:<6} {endpoint:<40} {errors / total:6.1%} ({errors}/{total})"
+                          for (method, endpoint), (total, errors) in totals.items()]
+            lines.append("建房阶段耗时:")
+            lines += [f"  {name:<12} 次数 {histogram.count:>5}  平均 {histogram.sum / histogram.count * 1000:7.1f} ms  "
+                      f"p90≤{_format_bound(histogram.quantile(0.9))}"
+                      for name, histogram in self.phases.items()]
+            if self.counters:
+                lines.append("计数:")
+                lines += [f"  {name}{dict(labels) if labels else ''}: {value}"
+                          for (name, labels), value in sorted(self.counters.items())]
+        return "\n".join(lines)
+
+
+def _prometheus_histogram(name, labels, histogram):
+    lines, cumulative = [], 0
+    for bound, count in zip(histogram.buckets, histogram.counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+    lines.append(f'{name}_sum{{{labels}}} {histogram.sum}')
+    lines.append(f'{name}_count{{{labels}}} {histogram.count}')
+    return lines
+
+
+def _format_bound(bound):
+    return f"{bound * 1000:g} ms" if bound is not None else "∞"
+
+
+# 进程内共享的指标，LCU传输层和建房流程默认记录到这里
+metrics = MetricsRegistry()
@@ -0,0 +1,393 @@
+import argparse
+import base64
+import hashlib
+import json
+import os
+import random
+import re
+import shutil
+import socket
+import ssl
+import struct
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+WEBSOCKET_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+LOBBY_EVENT = "OnJsonApiEvent_lol-lobby_v2_lobby"
+
+
+def generate_certificate(directory):
+    """用openssl生成自签名证书，返回(证书路径, 私钥路径)"""
+    if shutil.which('openssl') is None:
+        raise RuntimeError("生成自签名证书需要openssl")
+    cert, key = os.path.join(directory, 'cert.pem'), os.path.join(directory, 'key.pem')
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+                    '-subj', '/CN=127.0.0.1', '-keyout', key, '-out', cert],
+                   check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return cert, key
+
+
+class MockLCUServer:
+    """本地模拟的LCU HTTPS服务器
+
+    实现本项目用到的房间、人机、游戏状态接口和房间事件WebSocket，
+    可配置延迟、抖动和失败率，用于在没有英雄联盟客户端的环境下测试和压测。
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, failure_rate=0.0, create_delay=0.05, bot_delay=0.02,
+                 password="mock-password", legacy_v1=True, websocket=True, seed=None, cert=None, key=None,
+                 game_version="14.1.555.1234", champion_summary=None, available_bots=None):
+        self.latency = latency  # 每个请求的基础延迟（秒）
+        self.jitter = jitter  # 在基础延迟上叠加的随机延迟上限（秒）
+        self.failure_rate = failure_rate  # 请求返回500的概率
+        self.create_delay = create_delay  # 创建房间后多久房间才出现
+        self.bot_delay = bot_delay  # 添加人机后多久人机才出现在房间里
+        self.password = password
+        self.legacy_v1 = legacy_v1  # 为True时v1人机接口可用，否则只有v2
+        self.websocket = websocket
+        self.cert, self.key = cert, key
+        self.game_version = game_version
+        # 英雄概要列表，默认由ai_champions_data.json生成；available_bots为可作为人机的英雄ID
+        self.champion_summary = champion_summary if champion_summary is not None else _default_champion_summary()
+        self.available_bots = available_bots
+
+        self.lobby = None
+        self.phase = "None"
+        self.request_count = 0
+        self.connection_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._sockets = []
+        self._send_lock = threading.Lock()
+        self._server = None
+        self._tempdir = None
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    @property
+    def auth_token(self):
+        return base64.b64encode(f"riot:{self.password}".encode()).decode()
+
+    def start(self, port=0):
+        if self.cert is None:
+            self._tempdir = tempfile.TemporaryDirectory()
+            self.cert, self.key = generate_certificate(self._tempdir.name)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(self.cert, self.key)
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), _make_handler(self, context))
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="mock-lcu", daemon=True).start()
+        return self.port
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for sock in list(self._sockets):
+            _close_quietly(sock)
+        if self._tempdir is not None:
+            self._tempdir.cleanup()
+            self._tempdir = None
+
+    def write_lockfile(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"LeagueClient:{os.getpid()}:{self.port}:{self.password}:https")
+
+    def reset(self):
+        with self._lock:
+            self.lobby = None
+            self.phase = "None"
+        self._publish('/lol-lobby/v2/lobby', 'Delete', None)
+
+    def _delay(self):
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+            failed = self.failure_rate and self._random.random() < self.failure_rate
+        if delay:
+            time.sleep(delay)
+        return failed
+
+    def _later(self, delay, func, *args):
+        if delay:
+            timer = threading.Timer(delay, func, args)
+            timer.daemon = True
+            timer.start()
+        else:
+            func(*args)
+
+    def _create_lobby(self, payload):
+        config = payload.get('customGameLobby', {}).get('configuration', {})
+        lobby = {
+            "gameConfig": {
+                "isCustom": True,
+                "customLobbyName": payload.get('customGameLobby', {}).get('lobbyName', ''),
+                "mapId": config.get('mapId'),
+                "gameMode": config.get('gameMode'),
+                "maxLobbySize": 10,
+            },
+            "members": [{"isBot": False, "isLeader": True, "teamId": 100, "summonerName": "MockPlayer"}],
+        }
+        with self._lock:
+            self.lobby = lobby
+            self.phase = "Lobby"
+        self._publish('/lol-lobby/v2/lobby', 'Create', lobby)
+
+    def _add_bot(self, bot_data):
+        member = {
+            "isBot": True,
+            "botChampionId": int(bot_data['championId']),
+            "botDifficulty": bot_data.get('botDifficulty'),
+            "botPosition": bot_data.get('position'),
+            "teamId": int(bot_data.get('teamId', 200)),
+        }
+        with self._lock:
+            if self.lobby is None:
+                return
+            self.lobby['members'].append(member)
+            lobby = json.loads(json.dumps(self.lobby))
+        self._publish('/lol-lobby/v2/lobby', 'Update', lobby)
+
+    def _remove_bot(self, champion_id):
+        with self._lock:
+            if self.lobby is None:
+                return False
+            members = self.lobby['members']
+            for i, member in enumerate(members):
+                if member.get('isBot') and member.get('botChampionId') == champion_id:
+                    del members[i]
+                    break
+            else:
+                return False
+            lobby = json.loads(json.dumps(self.lobby))
+        self._publish('/lol-lobby/v2/lobby', 'Update', lobby)
+        return True
+
+    def _publish(self, uri, event_type, data):
+        frame = _websocket_frame(json.dumps([8, LOBBY_EVENT, {"uri": uri, "eventType": event_type, "data": data}]))
+        with self._send_lock:
+            for sock in list(self._sockets):
+                try:
+                    sock.sendall(frame)
+                except OSError:
+                    self._discard_socket(sock)
+
+    def _discard_socket(self, sock):
+        with self._lock:
+            if sock in self._sockets:
+                self._sockets.remove(sock)
+
+    def handle(self, method, path, body):
+        """返回(状态码, 响应对象)，响应对象为None时不带响应体"""
+        if self._delay():
+            return 500, {"message": "mock failure"}
+
+        if path == '/lol-gameflow/v1/gameflow-phase' and method == 'GET':
+            return 200, self.phase
+
+        if path == '/lol-patch/v1/game-version' and method == 'GET':
+            return 200, self.game_version
+
+        if path == '/lol-game-data/assets/v1/champion-summary.json' and method == 'GET':
+            return 200, self.champion_summary
+
+        if path == '/lol-lobby/v2/lobby/custom/available-bots' and method == 'GET':
+            ids = self.available_bots
+            if ids is None:
+                ids = [champion['id'] for champion in self.champion_summary if champion['id'] > 0]
+            return 200, [{"id": champ_id, "active": True} for champ_id in ids]
+
+        if path == '/lol-lobby/v2/lobby':
+            if method == 'GET':
+                with self._lock:
+                    lobby = json.loads(json.dumps(self.lobby)) if self.lobby else None
+                return (200, lobby) if lobby else (404, {"message": "LOBBY_NOT_FOUND"})
+            if method == 'POST':
+                # 新建房间会先离开旧房间，房间在create_delay之后出现
+                with self._lock:
+                    self.lobby = None
+                self._later(self.create_delay, self._create_lobby, body or {})
+                return 200, {}
+            if method == 'DELETE':
+                self.reset()
+                return 204, None
+
+        match = re.fullmatch(r'/lol-lobby/v(\d)/lobby/custom/bots(?:/(\d+))?', path)
+        if match and (match.group(1) == '2' or self.legacy_v1):
+            with self._lock:
+                in_lobby = self.lobby is not None
+            if not in_lobby:
+                return 404, {"message": "LOBBY_NOT_FOUND"}
+            if method == 'POST' and match.group(2) is None:
+                self._later(self.bot_delay, self._add_bot, body or {})
+                return 204, None
+            if method == 'DELETE' and match.group(2) is not None:
+                return (204, None) if self._remove_bot(int(match.group(2))) else (404, {"message": "BOT_NOT_FOUND"})
+
+        return 404, {"message": "RESOURCE_NOT_FOUND"}
+
+
+def _make_handler(server, context):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def setup(self):
+            # 在连接线程中完成TLS握手，避免多个连接的握手在accept线程中串行
+            self.request = context.wrap_socket(self.request, server_side=True)
+            with server._lock:
+                server.connection_count += 1
+            super().setup()
+
+        def log_message(self, format, *args):
+            pass
+
+        def _handle(self, method):
+            if self.headers.get('Authorization') != f"Basic {server.auth_token}":
+                return self._respond(401, {"message": "Unauthorized"})
+            if method == 'GET' and self.headers.get('Upgrade', '').lower() == 'websocket':
+                return self._websocket()
+
+            length = int(self.headers.get('Content-Length') or 0)
+            raw = self.rfile.read(length) if length else b''
+            try:
+                body = json.loads(raw) if raw else None
+            except ValueError:
+                return self._respond(400, {"message": "invalid json"})
+            with server._lock:
+                server.request_count += 1
+            status, payload = server.handle(method, self.path, body)
+            self._respond(status, payload)
+
+        def _respond(self, status, payload):
+            body = b'' if payload is None else json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _websocket(self):
+            if not server.websocket:
+                return self._respond(404, {"message": "websocket disabled"})
+            accept = base64.b64encode(
+                hashlib.sha1((self.headers['Sec-WebSocket-Key'] + WEBSOCKET_GUID).encode()).digest()).decode()
+            self.send_response(101)
+            self.send_header('Upgrade', 'websocket')
+            self.send_header('Connection', 'Upgrade')
+            self.send_header('Sec-WebSocket-Accept', accept)
+            self.send_header('Sec-WebSocket-Protocol', 'wamp')
+            self.end_headers()
+            self.wfile.flush()
+
+            sock = self.connection
+            with server._lock:
+                server._sockets.append(sock)
+            try:
+                # 只需处理订阅和关闭帧，事件由服务器主动推送
+                while _read_websocket_frame(self.rfile) is not None:
+                    pass
+            except (OSError, ValueError):
+                pass
+            server._discard_socket(sock)
+            self.close_connection = True
+
+        def do_GET(self):
+            self._handle('GET')
+
+        def do_POST(self):
+            self._handle('POST')
+
+        def do_DELETE(self):
+            self._handle('DELETE')
+
+    return Handler
+
+
+def _default_champion_summary(filename="ai_champions_data.json"):
+    """按客户端champion-summary.json的格式，由本地英雄数据生成概要列表（含id为-1的“无”）"""
+    summary = [{"id": -1, "name": "无", "alias": "None", "roles": []}]
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return summary
+    for champ in data.values():
+        summary.append({"id": champ['id'], "name": champ['name'], "alias": champ['alias'],
+                        "description": champ.get('title', ''), "roles": []})
+    return summary
+
+
+def _websocket_frame(text):
+    data = text.encode()
+    length = len(data)
+    if length < 126:
+        header = struct.pack('>BB', 0x81, length)
+    elif length < 65536:
+        header = struct.pack('>BBH', 0x81, 126, length)
+    else:
+        header = struct.pack('>BBQ', 0x81, 127, length)
+    return header + data
+
+
+def _read_websocket_frame(stream):
+    """读取一个客户端帧，收到关闭帧或连接断开时返回None"""
+    header = stream.read(2)
+    if len(header) < 2:
+        return None
+    opcode, length = header[0] & 0x0F, header[1] & 0x7F
+    if length == 126:
+        length = struct.unpack('>H', stream.read(2))[0]
+    elif length == 127:
+        length = struct.unpack('>Q', stream.read(8))[0]
+    mask = stream.read(4) if header[1] & 0x80 else b'\0\0\0\0'
+    payload = bytes(b ^ mask[i % 4] for i, b in enumerate(stream.read(length)))
+    return None if opcode == 0x8 else payload
+
+
+def _close_quietly(sock):
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+        sock.close()
+    except OSError:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="本地模拟LCU服务器")
+    parser.add_argument('--port', type=int, default=0, help="监听端口，默认随机")
+    parser.add_argument('--latency', type=float, default=0.0, help="每个请求的基础延迟（秒）")
+    parser.add_argument('--jitter', type=float, default=0.0, help="随机叠加的延迟上限（秒）")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="请求返回500的概率")
+    parser.add_argument('--create-delay', type=float, default=0.05, help="房间创建完成所需时间（秒）")
+    parser.add_argument('--bot-delay', type=float, default=0.02, help="人机进入房间所需时间（秒）")
+    parser.add_argument('--no-legacy-v1', action='store_true', help="不提供v1人机接口")
+    parser.add_argument('--no-websocket', action='store_true', help="不提供房间事件WebSocket")
+    parser.add_argument('--lockfile', help="写入lockfile，供凭证查找使用")
+    args = parser.parse_args()
+
+    server = MockLCUServer(latency=args.latency, jitter=args.jitter, failure_rate=args.failure_rate,
+                           create_delay=args.create_delay, bot_delay=args.bot_delay,
+                           legacy_v1=not args.no_legacy_v1, websocket=not args.no_websocket)
+    port = server.start(args.port)
+    if args.lockfile:
+        server.write_lockfile(args.lockfile)
+    print(f"模拟LCU已启动: https://127.0.0.1:{port}  token: {server.auth_token}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        if args.lockfile and os.path.exists(args.lockfile):
+            os.remove(args.lockfile)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from champions import POSITIONS
+
+DEFAULT_DB = "presets.db"
+LEGACY_FILE = "presets"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS presets (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE COLLATE NOCASE,
+    team TEXT NOT NULL,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS preset_tags (
+    tag TEXT NOT NULL COLLATE NOCASE,
+    preset_id INTEGER NOT NULL REFERENCES presets(id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, preset_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS preset_tags_preset ON preset_tags(preset_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def parse_preset_name(text):
+    """把“名称 #标签1 #标签2”拆成(名称, [标签])"""
+    name_parts, tags = [], []
+    for part in text.split():
+        if part.startswith('#') and len(part) > 1:
+            tags.append(part[1:])
+        else:
+            name_parts.append(part)
+    return " ".join(name_parts), tags
+
+
+class PresetStore:
+    """基于SQLite的命名预设库
+
+    每次保存/删除立即提交，只写入改动的那一条；名称和标签都有索引，
+    按页读取名称列表，预设数量增长后启动和保存的耗时保持不变。
+    预设只记录各位置的英雄ID，读取某个预设时才对照英雄数据还原。
+    """
+
+    def __init__(self, path=DEFAULT_DB, legacy_path=LEGACY_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        # 界面线程和命令行共用，所有访问都在锁内进行
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+        if legacy_path:
+            self._migrate_legacy(legacy_path)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _migrate_legacy(self, legacy_path):
+        """把旧版presets文件中的5个槽位导入为“预设 N”，只导入一次，旧文件保留不动"""
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_migrated'").fetchone():
+                return
+            try:
+                with open(legacy_path, 'r', encoding='utf-8') as f:
+                    legacy_presets = json.load(f)
+            except FileNotFoundError:
+                legacy_presets = []
+            except Exception as e:
+                print(f"读取旧版预设失败: {e}")
+                return
+
+            now = time.time()
+            with self._conn:
+                for i, preset in enumerate(legacy_presets):
+                    if not preset:
+                        continue
+                    team = {position: info['champion_id'] for position, info in preset.items()}
+                    self._conn.execute(
+                        "INSERT OR IGNORE INTO presets (name, team, created, updated) VALUES (?, ?, ?, ?)",
+                        (f"预设 {i}", json.dumps(team), now, now)
+                    )
+                self._conn.execute("INSERT INTO meta (key, value) VALUES ('legacy_migrated', ?)",
+                                   (os.path.abspath(legacy_path),))
+
+    def save(self, name, team, tags=None):
+        """保存（同名时覆盖）预设，team为{位置: 英雄信息或英雄ID}；tags为None时保留原有标签"""
+        name = name.strip()
+        if not name:
+            raise ValueError("预设名称不能为空")
+        champion_ids = {position: int(member['champion_id'] if isinstance(member, dict) else member)
+                        for position, member in team.items()}
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT id FROM presets WHERE name = ?", (name,)).fetchone()
+            if row:
+                preset_id = row[0]
+                self._conn.execute("UPDATE presets SET team = ?, updated = ? WHERE id = ?",
+                                   (json.dumps(champion_ids), now, preset_id))
+            else:
+                preset_id = self._conn.execute(
+                    "INSERT INTO presets (name, team, created, updated) VALUES (?, ?, ?, ?)",
+                    (name, json.dumps(champion_ids), now, now)
+                ).lastrowid
+            if tags is not None:
+                self._conn.execute("DELETE FROM preset_tags WHERE preset_id = ?", (preset_id,))
+                self._conn.executemany("INSERT OR IGNORE INTO preset_tags (tag, preset_id) VALUES (?, ?)",
+                                       [(tag, preset_id) for tag in tags if tag])
+        return preset_id
+
+    def delete(self, name):
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM presets WHERE name = ?", (name,)).rowcount > 0
+
+    def get(self, name):
+        """返回{'name', 'team': {位置: 英雄ID}, 'tags'}，不存在时返回None"""
+        with self._lock:
+            row = self._conn.execute("SELECT id, name, team FROM presets WHERE name = ?", (name,)).fetchone()
+            if not row:
+                return None
+            tags = [tag for tag, in self._conn.execute(
+                "SELECT tag FROM preset_tags WHERE preset_id = ? ORDER BY tag", (row[0],))]
+        return {'name': row[1], 'team': json.loads(row[2]), 'tags': tags}
+
+    def load_team(self, name, champions_data):
+        """读取预设并还原为队伍信息，英雄数据中已不存在的英雄会被跳过"""
+        preset = self.get(name)
+        if preset is None:
+            return None
+        return {position: champions_data.team_member(champ_id, position)
+                for position, champ_id in preset['team'].items()
+                if position in POSITIONS and str(champ_id) in champions_data}
+
+    def count(self, query="", tag=None):
+        sql, params = self._filter(query, tag)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM presets p{sql}", params).fetchone()[0]
+
+    def names(self, query="", tag=None, offset=0, limit=100):
+        """按名称排序分页返回预设名称；query匹配名称或标签（前缀），#开头时只匹配标签"""
+        sql, params = self._filter(query, tag)
+        with self._lock:
+            rows = self._conn.execute(f"SELECT p.name FROM presets p{sql} ORDER BY p.name LIMIT ? OFFSET ?",
+                                      params + [limit, offset])
+            return [name for name, in rows]
+
+    def tags(self):
+        """所有标签及其预设数量"""
+        with self._lock:
+            return self._conn.execute("SELECT tag, COUNT(*) FROM preset_tags GROUP BY tag ORDER BY tag").fetchall()
+
+    @staticmethod
+    def _filter(query, tag):
+        clauses, params = [], []
+        query = (query or "").strip()
+        if query.startswith('#'):
+            tag, query = query[1:], ""
+        if tag:
+            clauses.append("p.id IN (SELECT preset_id FROM preset_tags WHERE tag = ?)")
+            params.append(tag)
+        if query:
+            # 名称和标签都不区分大小写，前缀匹配可以走索引
+            pattern = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            clauses.append("(p.name LIKE ? ESCAPE '\\' OR p.id IN "
+                           "(SELECT preset_id FROM preset_tags WHERE tag LIKE ? ESCAPE '\\'))")
+            params += [pattern, pattern]
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
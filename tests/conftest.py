@@ -0,0 +1,78 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from champions import load_champions_data  # noqa: E402
+from lcu import LCUClient  # noqa: E402
+from mock_lcu import MockLCUServer, _default_champion_summary, generate_certificate  # noqa: E402
+
+CHAMPIONS_FILE = os.path.join(ROOT, "ai_champions_data.json")
+
+
+@pytest.fixture(scope="session")
+def champions_file():
+    return CHAMPIONS_FILE
+
+
+@pytest.fixture(scope="session")
+def catalog():
+    return load_champions_data(CHAMPIONS_FILE, use_cache=False)
+
+
+@pytest.fixture(scope="session")
+def certificate(tmp_path_factory):
+    # 生成证书较慢，所有模拟服务器共用一份
+    return generate_certificate(str(tmp_path_factory.mktemp("cert")))
+
+
+@pytest.fixture
+def lcu_server(certificate):
+    """本地模拟的LCU服务器，server.calls记录收到的每个(方法, 接口)，bot_ids()为房间中的人机英雄ID"""
+    cert, key = certificate
+    server = MockLCUServer(create_delay=0.1, bot_delay=0.02, cert=cert, key=key,
+                           champion_summary=_default_champion_summary(CHAMPIONS_FILE))
+    server.calls = []
+    handle = server.handle
+
+    def recording_handle(method, path, body):
+        server.calls.append((method, path))
+        return handle(method, path, body)
+
+    server.handle = recording_handle
+    server.bot_calls = lambda method: [path for m, path in server.calls
+                                       if m == method and '/lobby/custom/bots' in path]
+    server.bot_ids = lambda: sorted(member['botChampionId'] for member in (server.lobby or {}).get('members', [])
+                                    if member.get('isBot'))
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def make_client(lcu_server):
+    clients = []
+
+    def make():
+        client = LCUClient(str(lcu_server.port), lcu_server.auth_token)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def team_of(catalog):
+    """按上单、打野、中单、ADC、辅助的英文名生成队伍"""
+    positions = ["TOP", "JUNGLE", "MIDDLE", "BOTTOM", "UTILITY"]
+
+    def make(aliases):
+        return {position: catalog.team_member(catalog.find(alias)[0], position)
+                for position, alias in zip(positions, aliases)}
+
+    return make
@@ -0,0 +1,51 @@
+import pytest
+
+from lcu import LobbyBuilder
+
+TEAM = ["Urgot", "MasterYi", "Annie", "Sivir", "Soraka"]
+
+
+def fail_first_bot_post(server, applied):
+    """让第一次添加人机的请求返回500，applied为True时请求其实已经生效；失败的请求同样记入server.calls"""
+    handle = server.handle
+    state = {'failed': False}
+
+    def flaky_handle(method, path, body):
+        if method == 'POST' and path.endswith('/lobby/custom/bots') and not state['failed']:
+            state['failed'] = True
+            if applied:
+                handle(method, path, body)
+            else:
+                server.calls.append((method, path))
+            return 500, {"message": "mock failure"}
+        return handle(method, path, body)
+
+    server.handle = flaky_handle
+
+
+@pytest.mark.parametrize("applied, posts", [(True, 5), (False, 6)])
+def test_failed_add_retried_only_when_bot_absent(lcu_server, make_client, team_of, applied, posts):
+    fail_first_bot_post(lcu_server, applied)
+    result = LobbyBuilder(make_client(), 'X', '', team_of(TEAM)).run()
+    assert result == (True, "🎉 成功添加5个AI英雄！")
+    assert len(lcu_server.bot_calls('POST')) == posts
+    assert len(lcu_server.bot_ids()) == 5
+
+
+def test_failed_remove_retried(lcu_server, make_client, team_of):
+    LobbyBuilder(make_client(), 'X', '', team_of(TEAM)).run()
+    handle = lcu_server.handle
+    state = {'failed': False}
+
+    def flaky_handle(method, path, body):
+        if method == 'DELETE' and '/lobby/custom/bots/' in path and not state['failed']:
+            state['failed'] = True
+            lcu_server.calls.append((method, path))
+            return 500, {"message": "mock failure"}
+        return handle(method, path, body)
+
+    lcu_server.handle = flaky_handle
+    client = make_client()
+    assert client.clear_all_bots()
+    assert len(lcu_server.bot_calls('DELETE')) == 6
+    assert lcu_server.bot_ids() == []
@@ -0,0 +1,55 @@
+import threading
+import time
+
+import pytest
+
+from lcu import CancelToken, LobbyBuilder, LobbyEventStream, LobbyReadiness, OperationCancelled, cancel_scope
+
+TEAM = ["Urgot", "MasterYi", "Annie", "Sivir", "Soraka"]
+
+
+def test_child_token_follows_parent_and_own_deadline():
+    parent = CancelToken()
+    child = parent.child(timeout=0.05, reason="超时")
+    assert not child.cancelled
+    time.sleep(0.06)
+    assert child.cancelled and not parent.cancelled
+    with pytest.raises(OperationCancelled, match="超时"):
+        child.raise_if_cancelled()
+
+    other = parent.child()
+    parent.cancel()
+    assert other.cancelled
+
+
+def test_cancel_interrupts_sleep_immediately():
+    token = CancelToken()
+    threading.Timer(0.05, token.cancel).start()
+    start = time.monotonic()
+    with pytest.raises(OperationCancelled):
+        token.sleep(5)
+    assert time.monotonic() - start < 1
+
+
+def test_readiness_wakes_on_cancel(lcu_server, make_client):
+    client = make_client()
+    events = LobbyEventStream(client)
+    assert events.start()
+    token = CancelToken()
+    threading.Timer(0.1, token.cancel).start()
+    start = time.monotonic()
+    try:
+        with cancel_scope(token), pytest.raises(OperationCancelled):
+            LobbyReadiness(client, events).wait_for_custom_lobby('X', timeout=5)
+    finally:
+        events.stop()
+    assert time.monotonic() - start < 1
+
+
+def test_phase_deadline_stops_build(lcu_server, make_client, team_of, monkeypatch):
+    lcu_server.create_delay = 5
+    monkeypatch.setitem(LobbyBuilder.PHASE_DEADLINES, 'wait_lobby', 0.2)
+    start = time.monotonic()
+    success, message = LobbyBuilder(make_client(), 'X', '', team_of(TEAM)).run()
+    assert not success and message == "wait_lobby 阶段超时"
+    assert time.monotonic() - start < 2
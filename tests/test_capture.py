@@ -0,0 +1,58 @@
+import time
+
+import pytest
+
+from capture import install_recording, install_replay
+from lcu import LCUClient, LCUTransport, LobbyBuilder, credential_provider
+
+TEAM = ["Urgot", "MasterYi", "Annie", "Sivir", "Soraka"]
+
+
+@pytest.fixture
+def restore_transport():
+    yield
+    LCUClient.transport_factory = LCUTransport
+    credential_provider.pin(None)
+
+
+@pytest.fixture
+def recording(lcu_server, team_of, tmp_path, restore_transport):
+    """录制一次完整建房，返回(录制文件, 端口, 凭证, 录制时的结果)"""
+    path = str(tmp_path / "build.capture")
+    writer = install_recording(path)
+    client = LCUClient(str(lcu_server.port), lcu_server.auth_token)
+    try:
+        result = LobbyBuilder(client, 'X', '', team_of(TEAM)).run()
+    finally:
+        client.close()
+        writer.close()
+    LCUClient.transport_factory = LCUTransport
+    return path, str(lcu_server.port), lcu_server.auth_token, result
+
+
+@pytest.mark.parametrize("time_scale", [0, 0.5])
+def test_replay_reproduces_recorded_build(recording, team_of, time_scale):
+    path, port, token, recorded = recording
+    assert recorded == (True, "🎉 成功添加5个AI英雄！")
+
+    install_replay(path, time_scale)
+    assert credential_provider.get() == (port, "replay")
+    client = LCUClient(port, token)
+    start = time.monotonic()
+    try:
+        builder = LobbyBuilder(client, 'X', '', team_of(TEAM))
+        assert builder.run() == recorded
+    finally:
+        client.close()
+    assert time.monotonic() - start < 3
+    assert builder.timings['wait_lobby'] < 1
+
+
+def test_replay_returns_404_for_unrecorded_requests(recording):
+    path, port, token, _ = recording
+    install_replay(path, 0)
+    client = LCUClient(port, token)
+    try:
+        assert client.get_game_version() is None
+    finally:
+        client.close()
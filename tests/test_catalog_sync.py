@@ -0,0 +1,74 @@
+import json
+import os
+import shutil
+
+import pytest
+
+import catalog_sync
+from catalog_sync import CatalogSync, load_catalog
+
+
+@pytest.fixture
+def files(tmp_path, champions_file):
+    overrides = str(tmp_path / 'ai_champions_data.json')
+    shutil.copy(champions_file, overrides)
+    return overrides, str(tmp_path / 'ai_champions_synced.json')
+
+
+def summary_requests(server):
+    return [call for call in server.calls if call[1] == '/lol-game-data/assets/v1/champion-summary.json']
+
+
+def test_refresh_only_when_game_version_changes(lcu_server, make_client, files):
+    sync = CatalogSync(make_client(), *files)
+    assert sync.refresh() is not None
+    assert sync.refresh() is None
+    assert len(summary_requests(lcu_server)) == 1
+
+    lcu_server.game_version = "14.2.1.1"
+    assert sync.refresh() is not None
+    assert len(summary_requests(lcu_server)) == 2
+    assert sync.refresh(force=True) is not None
+    assert len(summary_requests(lcu_server)) == 3
+
+
+def test_new_champion_enabled_only_when_available_as_bot(lcu_server, make_client, files):
+    lcu_server.champion_summary = lcu_server.champion_summary + [
+        {"id": 9001, "name": "新英雄", "alias": "Newcomer", "roles": ["marksman"]},
+        {"id": 9002, "name": "未开放", "alias": "Hidden", "roles": ["tank"]},
+    ]
+    lcu_server.available_bots = [9001]
+    catalog = CatalogSync(make_client(), *files).refresh()
+    assert catalog['9001']['positions'] == ['BOTTOM']
+    assert '9002' not in catalog
+
+
+def test_load_catalog_uses_compiled_cache(lcu_server, make_client, files, monkeypatch):
+    overrides, sync_file = files
+    synced = CatalogSync(make_client(), overrides, sync_file).refresh()
+    assert load_catalog(overrides, sync_file) == synced
+
+    def unexpected_parse(raw):
+        raise AssertionError("同步文件不应被重新解析")
+
+    monkeypatch.setattr(catalog_sync, '_parse_sync_state', unexpected_parse)
+    cached = load_catalog(overrides, sync_file)
+    assert cached == synced
+    assert cached.position_ids == synced.position_ids
+    # 只是修改时间变化时按内容哈希沿用缓存
+    os.utime(sync_file)
+    assert load_catalog(overrides, sync_file) == synced
+
+
+def test_load_catalog_remerges_after_local_edit(lcu_server, make_client, files):
+    overrides, sync_file = files
+    CatalogSync(make_client(), overrides, sync_file).refresh()
+    assert '1' in load_catalog(overrides, sync_file)
+
+    with open(overrides, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    data['1']['enable'] = 0
+    with open(overrides, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    assert '1' not in load_catalog(overrides, sync_file)
+    assert '1' not in load_catalog(overrides, sync_file)
@@ -0,0 +1,94 @@
+import os
+import time
+
+import pytest
+
+from lcu import LCUCredentialProvider
+
+
+class FakeClient:
+    """在假的/proc和安装目录中模拟客户端的启动与退出"""
+
+    def __init__(self, root):
+        self.proc = os.path.join(root, 'proc')
+        self.install = os.path.join(root, 'League of Legends')
+        self.lockfile = os.path.join(self.install, 'lockfile')
+        os.makedirs(os.path.join(self.proc, '100'))
+        os.makedirs(self.install)
+
+    def start(self, port=5000, password='token'):
+        with open(os.path.join(self.proc, '100', 'cmdline'), 'wb') as f:
+            f.write(f"LeagueClientUx.exe\0--app-port={port}\0--remoting-auth-token={password}\0"
+                    f"--install-directory={self.install}\0".encode())
+        with open(self.lockfile, 'w', encoding='utf-8') as f:
+            f.write(f"LeagueClient:1:{port}:{password}:https")
+
+    def exit(self, keep_lockfile=False):
+        os.remove(os.path.join(self.proc, '100', 'cmdline'))
+        if not keep_lockfile:
+            os.remove(self.lockfile)
+
+
+@pytest.fixture
+def fake_client(tmp_path):
+    return FakeClient(str(tmp_path))
+
+
+@pytest.fixture
+def provider(fake_client, tmp_path):
+    provider = LCUCredentialProvider([str(tmp_path / 'not-installed' / 'lockfile')], proc_root=fake_client.proc)
+    provider.scans = 0
+    command_lines = provider._command_lines
+
+    def counting_command_lines():
+        provider.scans += 1
+        return command_lines()
+
+    provider._command_lines = counting_command_lines
+    return provider
+
+
+def test_provider_polls_lockfile_without_scanning(fake_client, provider):
+    fake_client.start()
+    for _ in range(5):
+        assert provider.get()[0] == '5000'
+    assert provider.scans == 1
+
+
+def test_provider_does_not_scan_after_client_exits(fake_client, provider):
+    fake_client.start()
+    assert provider.get()[0] == '5000'
+    provider.invalidate()
+    fake_client.exit()
+    for _ in range(5):
+        assert provider.get() == (None, None)
+    assert provider.scans == 1
+
+    fake_client.start(port=5001)
+    assert provider.get()[0] == '5001'
+    assert provider.scans == 1
+
+
+def test_provider_ignores_stale_lockfile_until_rewritten(fake_client, provider):
+    fake_client.start()
+    assert provider.get()[0] == '5000'
+    provider.invalidate()
+    fake_client.exit(keep_lockfile=True)
+    assert provider.get() == (None, None)
+
+    time.sleep(0.01)
+    fake_client.start(port=5002)
+    assert provider.get()[0] == '5002'
+
+
+def test_lockfile_override_from_environment(tmp_path, monkeypatch):
+    lockfile = tmp_path / 'lockfile'
+    lockfile.write_text("LeagueClient:1:5003:token:https", encoding='utf-8')
+    monkeypatch.setenv(LCUCredentialProvider.LOCKFILE_ENV, str(lockfile))
+    provider = LCUCredentialProvider(proc_root=str(tmp_path / 'proc'))
+    assert provider.get()[0] == '5003'
+
+    other = tmp_path / 'other'
+    other.write_text("LeagueClient:1:5004:token:https", encoding='utf-8')
+    provider.use_lockfile(str(other))
+    assert provider.get()[0] == '5004'
@@ -0,0 +1,141 @@
+import threading
+
+import pytest
+
+from jobs import CANCELLED, FAILED, SUCCEEDED, LobbyJob, LobbyJobScheduler
+from lcu import LCUClient, LCUClientRegistry, LCUCredentialProvider
+
+TEAM = ["Urgot", "MasterYi", "Annie", "Sivir", "Soraka"]
+
+
+@pytest.fixture
+def registry(lcu_server, tmp_path):
+    provider = LCUCredentialProvider([str(tmp_path / 'lockfile')], proc_root=str(tmp_path / 'proc'))
+    provider.pin([(str(lcu_server.port), lcu_server.auth_token)])
+    registry = LCUClientRegistry(provider)
+    yield registry
+    registry.close()
+
+
+class RunningTracker:
+    """记录同一客户端上同时执行的任务数的峰值"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = {}
+        self.peak = 0
+
+    def __call__(self, job):
+        with self.lock:
+            if job.status == 'running':
+                self.running[job.id] = job.port
+            else:
+                self.running.pop(job.id, None)
+            per_port = {}
+            for port in self.running.values():
+                per_port[port] = per_port.get(port, 0) + 1
+            self.peak = max([self.peak] + list(per_port.values()))
+
+
+@pytest.mark.parametrize("port", [None, "server"])
+def test_one_job_per_client_at_a_time(lcu_server, registry, team_of, port):
+    tracker = RunningTracker()
+    scheduler = LobbyJobScheduler(registry, workers=3, on_update=tracker)
+    job_port = lcu_server.port if port == "server" else None
+    try:
+        jobs = [scheduler.submit(LobbyJob('X', '', team_of(TEAM), port=job_port)) for _ in range(3)]
+        assert scheduler.wait(20)
+    finally:
+        scheduler.shutdown()
+    assert [job.status for job in jobs] == [SUCCEEDED] * 3
+    assert tracker.peak == 1
+
+
+def test_higher_priority_runs_first(lcu_server, registry, team_of):
+    order = []
+
+    def on_update(job):
+        if job.status == 'running' and job.priority not in order:
+            order.append(job.priority)
+
+    scheduler = LobbyJobScheduler(registry, workers=1, on_update=on_update)
+    started, submitted = threading.Event(), threading.Event()
+
+    def first_team():
+        started.set()
+        submitted.wait(5)
+        return team_of(TEAM)
+
+    try:
+        # 第一个任务执行期间提交的任务按优先级排序
+        scheduler.submit(LobbyJob('X', '', first_team, priority=0))
+        assert started.wait(5)
+        for priority in (1, 5, 3):
+            scheduler.submit(LobbyJob('X', '', team_of(TEAM), priority=priority))
+        submitted.set()
+        assert scheduler.wait(20)
+    finally:
+        scheduler.shutdown()
+    assert order == [0, 5, 3, 1]
+
+
+def test_cancel_queued_job(lcu_server, registry, team_of):
+    scheduler = LobbyJobScheduler(registry, workers=1)
+    try:
+        first = scheduler.submit(LobbyJob('X', '', team_of(TEAM)))
+        second = scheduler.submit(LobbyJob('X', '', team_of(TEAM)))
+        assert scheduler.cancel(second.id)
+        assert scheduler.wait(20)
+    finally:
+        scheduler.shutdown()
+    assert first.status == SUCCEEDED
+    assert second.status == CANCELLED
+
+
+def test_job_fails_without_client(tmp_path):
+    provider = LCUCredentialProvider([str(tmp_path / 'lockfile')], proc_root=str(tmp_path / 'proc'))
+    provider.pin([])
+    scheduler = LobbyJobScheduler(LCUClientRegistry(provider), workers=2)
+    try:
+        jobs = [scheduler.submit(LobbyJob('X', '', {})), scheduler.submit(LobbyJob('X', '', {}, port=1234))]
+        assert scheduler.wait(5)
+    finally:
+        scheduler.shutdown()
+    assert [job.status for job in jobs] == [FAILED, FAILED]
+    assert jobs[1].message == "未找到端口为 1234 的客户端"
+
+
+def test_refresh_keeps_client_until_job_finishes(lcu_server, tmp_path, team_of):
+    provider = LCUCredentialProvider([str(tmp_path / 'lockfile')], proc_root=str(tmp_path / 'proc'))
+    provider.pin([(str(lcu_server.port), lcu_server.auth_token)])
+    closed = []
+
+    class TrackedClient(LCUClient):
+        def close(self):
+            closed.append(self)
+            super().close()
+
+    registry = LCUClientRegistry(provider, client_factory=TrackedClient)
+    scheduler = LobbyJobScheduler(registry, workers=1)
+    started, refreshed = threading.Event(), threading.Event()
+
+    def team():
+        started.set()
+        refreshed.wait(5)
+        return team_of(TEAM)
+
+    try:
+        [client] = registry.refresh()
+        job = scheduler.submit(LobbyJob('X', '', team))
+        assert started.wait(5)
+        # 任务执行中客户端重启（凭证变化），旧客户端要等任务结束才关闭
+        provider.pin([(str(lcu_server.port), 'restarted')])
+        assert registry.refresh() != [client]
+        assert closed == []
+        refreshed.set()
+        assert scheduler.wait(20)
+    finally:
+        scheduler.shutdown()
+        registry.close()
+    assert job.status == SUCCEEDED
+    assert closed[0] is client
@@ -0,0 +1,54 @@
+import itertools
+
+import pytest
+
+import champions
+from champions import POSITIONS, iter_lineup_batches, sample_lineups
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """分别用NumPy和纯Python实现生成阵容"""
+    if request.param == "python":
+        monkeypatch.setattr(champions, '_import_numpy', lambda: None)
+    else:
+        pytest.importorskip("numpy")
+    return request.param
+
+
+def test_same_seed_reproduces_lineups(catalog, backend):
+    first = list(sample_lineups(catalog, 50, seed=7))
+    assert first == list(sample_lineups(catalog, 50, seed=7))
+    assert first != list(sample_lineups(catalog, 50, seed=8))
+    # 前N个阵容与生成总数无关
+    assert list(sample_lineups(catalog, 20, seed=7, batch_size=16)) == \
+        list(itertools.islice(sample_lineups(catalog, 50, seed=7, batch_size=16), 20))
+
+
+def test_lineups_have_no_duplicate_champions(catalog, backend):
+    for lineup in sample_lineups(catalog, 200, seed=1, batch_size=64):
+        assert sorted(lineup) == ["100", "200"]
+        ids = [champ_id for team in lineup.values() for champ_id in team.values()]
+        assert len(set(ids)) == len(ids)
+        for team in lineup.values():
+            for position, champ_id in team.items():
+                assert champ_id in catalog.position_ids[position]
+
+
+def test_batches_cover_count(catalog, backend):
+    batches = list(iter_lineup_batches(catalog, 100, seed=3, team_ids=("200",), batch_size=32))
+    assert [len(batch) for batch in batches] == [32, 32, 32, 4]
+    assert all(len(row) == len(POSITIONS) for batch in batches for row in batch)
+
+
+def test_exclude_and_zero_weight_never_drawn(catalog, backend):
+    annie, sivir = catalog.find('Annie')[0], catalog.find('Sivir')[0]
+    lineups = list(sample_lineups(catalog, 200, seed=5, exclude=[annie], weights={sivir: 0}))
+    ids = {champ_id for lineup in lineups for team in lineup.values() for champ_id in team.values()}
+    assert annie not in ids and sivir not in ids
+
+
+def test_too_few_champions_raises(catalog, backend):
+    utility = catalog.position_ids['UTILITY']
+    with pytest.raises(ValueError):
+        list(sample_lineups(catalog, 1, exclude=utility))
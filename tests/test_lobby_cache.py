@@ -0,0 +1,67 @@
+import time
+
+from lcu import LobbySnapshotCache
+
+LOBBY_GET = ('GET', '/lol-lobby/v2/lobby')
+
+
+def test_store_expires_after_ttl():
+    cache = LobbySnapshotCache(ttl=0.05)
+    hit, _, generation = cache.lookup()
+    assert not hit
+    cache.store({'members': []}, generation)
+    assert cache.lookup()[:2] == (True, {'members': []})
+    time.sleep(0.06)
+    assert not cache.lookup()[0]
+
+
+def test_store_from_older_generation_is_dropped():
+    cache = LobbySnapshotCache(ttl=5)
+    _, _, generation = cache.lookup()
+    cache.invalidate()  # 查询进行中本客户端修改了房间
+    cache.store({'stale': True}, generation)
+    assert not cache.lookup()[0]
+
+    _, _, generation = cache.lookup()
+    cache.update({'event': True})  # 房间事件比进行中的查询更新
+    cache.store({'stale': True}, generation)
+    assert cache.lookup()[:2] == (True, {'event': True})
+
+
+def test_get_lobby_reuses_snapshot_until_mutation(lcu_server, make_client, catalog):
+    client = make_client()
+    assert client.create_custom_lobby(lobby_name='X')
+    time.sleep(0.2)
+    lcu_server.calls.clear()
+
+    lobby = client.get_lobby()
+    assert lobby['gameConfig']['customLobbyName'] == 'X'
+    assert client.get_lobby() == lobby
+    assert lcu_server.calls.count(LOBBY_GET) == 1
+    assert client.get_lobby(fresh=True) == lobby
+    assert lcu_server.calls.count(LOBBY_GET) == 2
+
+    assert client.add_bot({"championId": catalog.find('Urgot')[0], "botDifficulty": "RSINTERMEDIATE",
+                           "teamId": "200", "position": "TOP"})
+    client.get_lobby()
+    assert lcu_server.calls.count(LOBBY_GET) == 3
+
+
+def test_snapshot_read_during_mutation_not_cached(lcu_server, make_client):
+    client = make_client()
+    assert client.create_custom_lobby(lobby_name='X')
+    time.sleep(0.2)
+    handle = lcu_server.handle
+
+    def racing_handle(method, path, body):
+        response = handle(method, path, body)
+        if (method, path) == LOBBY_GET:
+            client.lobby_cache.invalidate()  # 响应返回前本客户端又修改了房间
+        return response
+
+    lcu_server.handle = racing_handle
+    client.get_lobby()
+    lcu_server.handle = handle
+    lcu_server.calls.clear()
+    client.get_lobby()
+    assert lcu_server.calls.count(LOBBY_GET) == 1
@@ -0,0 +1,67 @@
+import json
+
+from metrics import Histogram, MetricsRegistry, normalize_endpoint
+
+
+def filled_registry():
+    registry = MetricsRegistry()
+    registry.observe_request('DELETE', '/lol-lobby/v2/lobby/custom/bots/11', 204, 0.003)
+    registry.observe_request('DELETE', '/lol-lobby/v2/lobby/custom/bots/22?x=1', 204, 0.2)
+    registry.observe_phase('add', 0.4)
+    registry.inc("lcu_request_retries_total", method="GET")
+    registry.inc("lcu_request_retries_total", 2, method="GET")
+    registry.inc("lcu_circuit_open_total")
+    return registry
+
+
+def test_normalize_endpoint_groups_ids():
+    assert normalize_endpoint('/lol-lobby/v2/lobby/custom/bots/11') == '/lol-lobby/v2/lobby/custom/bots/{id}'
+    assert normalize_endpoint('/lol-lobby/v2/lobby?x=1') == '/lol-lobby/v2/lobby'
+
+
+def test_histogram_buckets_and_quantile():
+    histogram = Histogram(buckets=(0.01, 0.1, 1))
+    for value in (0.005, 0.01, 0.05, 0.5, 5):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1, 1]
+    assert histogram.quantile(0.4) == 0.01
+    assert histogram.quantile(0.8) == 1
+    assert histogram.quantile(1) is None
+    assert Histogram().quantile(0.5) is None
+
+
+def test_prometheus_export():
+    text = filled_registry().to_prometheus()
+    labels = 'method="DELETE",endpoint="/lol-lobby/v2/lobby/custom/bots/{id}",status="204"'
+    assert f'lcu_request_duration_seconds_bucket{{{labels},le="0.005"}} 1' in text
+    assert f'lcu_request_duration_seconds_bucket{{{labels},le="0.25"}} 2' in text
+    assert f'lcu_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f'lcu_request_duration_seconds_count{{{labels}}} 2' in text
+    assert 'lobby_phase_duration_seconds_count{phase="add"} 1' in text
+    assert '# TYPE lcu_request_retries_total counter\nlcu_request_retries_total{method="GET"} 3' in text
+    assert '\nlcu_circuit_open_total 1\n' in text
+
+
+def test_json_snapshot_and_write(tmp_path):
+    registry = filled_registry()
+    path = str(tmp_path / 'metrics.json')
+    registry.write(path)
+    with open(path, encoding='utf-8') as f:
+        snapshot = json.load(f)
+    [request] = snapshot['requests']
+    assert (request['method'], request['status'], request['count']) == ('DELETE', '204', 2)
+    assert request['endpoint'] == '/lol-lobby/v2/lobby/custom/bots/{id}'
+    assert snapshot['phases']['add']['count'] == 1
+    assert {"name": "lcu_request_retries_total", "labels": {"method": "GET"}, "value": 3} in snapshot['counters']
+
+    prom_path = str(tmp_path / 'metrics.prom')
+    registry.write(prom_path)
+    with open(prom_path, encoding='utf-8') as f:
+        assert f.read() == registry.to_prometheus()
+
+
+def test_reset_clears_everything():
+    registry = filled_registry()
+    registry.reset()
+    snapshot = registry.snapshot()
+    assert snapshot['requests'] == [] and snapshot['phases'] == {} and snapshot['counters'] == []
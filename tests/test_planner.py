@@ -0,0 +1,66 @@
+from lcu import LobbyBuilder, plan_lobby_changes
+
+TEAM = ["Urgot", "MasterYi", "Annie", "Sivir", "Soraka"]
+
+
+def test_plan_keeps_matching_bots(catalog, team_of):
+    team = team_of(TEAM)
+    lobby = {
+        'gameConfig': {'isCustom': True, 'customLobbyName': 'X', 'mapId': 11, 'gameMode': 'CLASSIC'},
+        'members': [{'isBot': True, 'botChampionId': info['champion_id'], 'teamId': 200,
+                     'botPosition': position, 'botDifficulty': 'RSINTERMEDIATE'}
+                    for position, info in team.items()],
+    }
+    team['MIDDLE'] = catalog.team_member(catalog.find('TwistedFate')[0], 'MIDDLE')
+
+    plan = plan_lobby_changes({'200': team}, lobby, 'X')
+
+    assert not plan.create_lobby
+    assert [member['botChampionId'] for member in plan.removals] == [catalog.find('Annie')[0]]
+    assert [bot['champion_id'] for bot in plan.additions] == [catalog.find('TwistedFate')[0]]
+    assert len(plan.kept) == 4
+
+
+def test_plan_creates_lobby_for_other_name(team_of):
+    lobby = {'gameConfig': {'isCustom': True, 'customLobbyName': 'Y'}, 'members': []}
+    plan = plan_lobby_changes({'200': team_of(TEAM)}, lobby, 'X')
+    assert plan.create_lobby
+    assert plan.removals == [] and len(plan.additions) == 5
+
+
+def test_changing_one_champion_reconciles_in_place(lcu_server, make_client, catalog, team_of):
+    client = make_client()
+    team = team_of(TEAM)
+    assert LobbyBuilder(client, 'X', '', team).run()[0]
+
+    lcu_server.calls.clear()
+    team['MIDDLE'] = catalog.team_member(catalog.find('TwistedFate')[0], 'MIDDLE')
+    builder = LobbyBuilder(client, 'X', '', team)
+    assert builder.run() == (True, "🎉 成功添加5个AI英雄！")
+
+    assert ('POST', '/lol-lobby/v2/lobby') not in lcu_server.calls
+    assert len(lcu_server.bot_calls('DELETE')) == 1
+    assert len(lcu_server.bot_calls('POST')) == 1
+    assert lcu_server.bot_ids() == sorted(info['champion_id'] for info in team.values())
+
+
+def test_new_client_does_not_reuse_lobby_with_unknown_password(lcu_server, make_client, team_of):
+    assert LobbyBuilder(make_client(), 'X', '', team_of(TEAM)).run()[0]
+
+    lcu_server.calls.clear()
+    assert LobbyBuilder(make_client(), 'X', 'secret', team_of(TEAM)).run()[0]
+    assert ('POST', '/lol-lobby/v2/lobby') in lcu_server.calls
+
+
+def test_building_one_team_keeps_bots_on_the_other(lcu_server, make_client, team_of):
+    client = make_client()
+    blue = team_of(TEAM)
+    red = team_of(["Tryndamere", "Amumu", "Veigar", "Ashe", "Sona"])
+    assert LobbyBuilder(client, 'X', '', blue, team_id="100").run()[0]
+
+    lcu_server.calls.clear()
+    assert LobbyBuilder(client, 'X', '', red, team_id="200").run() == (True, "🎉 成功添加5个AI英雄！")
+
+    assert ('POST', '/lol-lobby/v2/lobby') not in lcu_server.calls
+    assert lcu_server.bot_calls('DELETE') == []
+    assert lcu_server.bot_ids() == sorted(info['champion_id'] for info in list(blue.values()) + list(red.values()))
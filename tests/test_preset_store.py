@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from preset_store import PresetStore, parse_preset_name
+
+TEAM = ["Urgot", "MasterYi", "Annie", "Sivir", "Soraka"]
+
+
+@pytest.fixture
+def open_store(tmp_path):
+    stores = []
+
+    def make(legacy=None):
+        legacy_path = tmp_path / 'presets'
+        if legacy is not None:
+            legacy_path.write_text(json.dumps(legacy), encoding='utf-8')
+        store = PresetStore(str(tmp_path / 'presets.db'), str(legacy_path))
+        stores.append(store)
+        return store
+
+    yield make
+    for store in stores:
+        store.close()
+
+
+def test_parse_preset_name():
+    assert parse_preset_name("下路练习 #adc  #快速") == ("下路练习", ["adc", "快速"])
+    assert parse_preset_name("# 单独的井号") == ("# 单独的井号", [])
+
+
+def test_save_overwrites_same_name_and_keeps_tags(open_store, catalog, team_of):
+    store = open_store()
+    team = team_of(TEAM)
+    store.save("练习", team, tags=["adc"])
+    team['MIDDLE'] = catalog.team_member(catalog.find('TwistedFate')[0], 'MIDDLE')
+    store.save("练习", team)
+
+    assert store.count() == 1
+    preset = store.get("练习")
+    assert preset['tags'] == ["adc"]
+    assert preset['team']['MIDDLE'] == catalog.find('TwistedFate')[0]
+    assert store.load_team("练习", catalog) == team
+    with pytest.raises(ValueError):
+        store.save("  ", team)
+
+
+def test_names_filter_by_prefix_and_tag(open_store, team_of):
+    store = open_store()
+    team = team_of(TEAM)
+    store.save("Alpha", team, tags=["ranked"])
+    store.save("alpine", team)
+    store.save("Beta", team, tags=["RANKED", "aram"])
+
+    assert store.names("al") == ["Alpha", "alpine"]
+    assert store.names("ar") == ["Beta"]  # 按标签前缀匹配
+    assert store.names("#ranked") == ["Alpha", "Beta"]
+    assert store.names(tag="aram") == ["Beta"]
+    assert store.names(offset=1, limit=1) == ["alpine"]
+    assert store.count("%") == 0
+    assert store.tags() == [("aram", 1), ("ranked", 2)]
+
+
+def test_delete_removes_tags(open_store, team_of):
+    store = open_store()
+    store.save("练习", team_of(TEAM), tags=["adc"])
+    assert store.delete("练习")
+    assert not store.delete("练习")
+    assert store.get("练习") is None
+    assert store.tags() == []
+
+
+def test_load_team_skips_unknown_champions(open_store, catalog, team_of):
+    store = open_store()
+    team = team_of(TEAM)
+    store.save("练习", dict(team, TOP=999999))
+    del team['TOP']
+    assert store.load_team("练习", catalog) == team
+    assert store.load_team("不存在", catalog) is None
+
+
+def test_legacy_slots_migrated_once(open_store, catalog, team_of, tmp_path):
+    team = team_of(TEAM)
+    store = open_store(legacy=[team, None, {}, team, None])
+    assert store.names() == ["预设 0", "预设 3"]
+    assert store.load_team("预设 3", catalog) == team
+
+    # 迁移后删除的预设不会在下次打开时又被导入，旧文件保留不动
+    store.delete("预设 0")
+    store.close()
+    reopened = open_store()
+    assert reopened.names() == ["预设 3"]
+    assert (tmp_path / 'presets').exists()
@@ -0,0 +1,35 @@
+import time
+
+import pytest
+
+from lcu import LobbyBuilder, LobbyEventStream, LobbyReadiness
+
+TEAM = ["Urgot", "MasterYi", "Annie", "Sivir", "Soraka"]
+
+
+def test_same_name_rebuild_waits_for_new_lobby(lcu_server, make_client, team_of):
+    client = make_client()
+    assert LobbyBuilder(client, 'X', 'A', team_of(TEAM)).run() == (True, "🎉 成功添加5个AI英雄！")
+
+    builder = LobbyBuilder(client, 'X', 'B', team_of(TEAM))
+    assert builder.run() == (True, "🎉 成功添加5个AI英雄！")
+    # 旧房间同名，必须等到新房间创建完成（create_delay）才算就绪
+    assert builder.timings['wait_lobby'] >= lcu_server.create_delay * 0.5
+    assert len(lcu_server.bot_ids()) == 5
+
+
+@pytest.mark.parametrize("use_events", [True, False])
+def test_readiness_returns_when_lobby_appears(lcu_server, make_client, use_events):
+    client = make_client()
+    events = LobbyEventStream(client)
+    if use_events:
+        assert events.start()
+    readiness = LobbyReadiness(client, events)
+    try:
+        assert client.create_custom_lobby(lobby_name='X')
+        start = time.monotonic()
+        assert readiness.wait_for_custom_lobby('X', timeout=3)
+        assert time.monotonic() - start < 1
+        assert not readiness.wait_for_custom_lobby('Y', timeout=0.1)
+    finally:
+        events.stop()
@@ -0,0 +1,111 @@
+import socket
+import time
+
+import pytest
+import requests
+
+from lcu import CircuitOpenError, LCUTransport, ResiliencePolicy
+from metrics import MetricsRegistry
+
+
+def fail_requests(server, method, times, status=500):
+    """让接下来times次该方法的请求返回status"""
+    handle = server.handle
+    remaining = [times]
+
+    def flaky_handle(request_method, path, body):
+        if request_method == method and remaining[0] > 0:
+            remaining[0] -= 1
+            return status, {"message": "mock failure"}
+        return handle(request_method, path, body)
+
+    server.handle = flaky_handle
+    return remaining
+
+
+@pytest.fixture
+def make_transport():
+    transports = []
+
+    def make(port, token="", **policy):
+        policy.setdefault('backoff', 0)
+        transport = LCUTransport(f"https://127.0.0.1:{port}", {"Authorization": f"Basic {token}"},
+                                 metrics=MetricsRegistry(), policy=ResiliencePolicy(**policy))
+        transports.append(transport)
+        return transport
+
+    yield make
+    for transport in transports:
+        transport.close()
+
+
+def unused_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_timeouts_by_endpoint():
+    policy = ResiliencePolicy(connect_timeout=0.5, read_timeout=2)
+    assert policy.timeout('GET', '/lol-gameflow/v1/gameflow-phase') == (0.5, 1)
+    assert policy.timeout('POST', '/lol-lobby/v2/lobby') == (0.5, 4)
+    assert policy.timeout('POST', '/lol-lobby/v2/lobby/custom/bots') == (0.5, 2)
+    assert policy.timeout('GET', '/riotclient/region-locale') == (0.5, 2)
+
+
+def test_only_idempotent_methods_retried():
+    policy = ResiliencePolicy(max_retries=2)
+    assert policy.should_retry('GET', 0)
+    assert policy.should_retry('DELETE', 1, 503)
+    assert not policy.should_retry('GET', 2)
+    assert not policy.should_retry('GET', 0, 404)
+    assert not policy.should_retry('POST', 0)
+
+
+def test_circuit_opens_after_consecutive_failures_and_probes_after_cooldown():
+    policy = ResiliencePolicy(failure_threshold=2, reset_timeout=0.05)
+    policy.record_failure()
+    policy.before_request()
+    policy.record_failure()
+    assert policy.is_open
+    with pytest.raises(CircuitOpenError):
+        policy.before_request()
+
+    time.sleep(0.06)
+    policy.before_request()  # 冷却后放行一个探测请求
+    policy.record_failure()  # 探测失败时重新熔断
+    with pytest.raises(CircuitOpenError):
+        policy.before_request()
+
+    time.sleep(0.06)
+    policy.before_request()
+    policy.record_success()
+    assert not policy.is_open
+
+
+def test_get_retried_on_server_error(lcu_server, make_transport):
+    remaining = fail_requests(lcu_server, 'GET', 2)
+    transport = make_transport(lcu_server.port, lcu_server.auth_token)
+    response = transport.request('/lol-gameflow/v1/gameflow-phase')
+    assert response.status_code == 200
+    assert remaining == [0]
+    assert transport.metrics.counters[('lcu_request_retries_total', (('method', 'GET'),))] == 2
+
+
+def test_post_not_retried(lcu_server, make_transport):
+    remaining = fail_requests(lcu_server, 'POST', 1)
+    transport = make_transport(lcu_server.port, lcu_server.auth_token)
+    response = transport.request('/lol-lobby/v2/lobby/custom/bots', 'POST', {})
+    assert response.status_code == 500
+    assert remaining == [0]
+
+
+def test_unreachable_client_opens_circuit(make_transport):
+    transport = make_transport(unused_port(), failure_threshold=3, max_retries=2)
+    with pytest.raises(requests.ConnectionError):
+        transport.request('/lol-gameflow/v1/gameflow-phase')
+    assert transport.policy.is_open
+    start = time.monotonic()
+    with pytest.raises(CircuitOpenError):
+        transport.request('/lol-gameflow/v1/gameflow-phase')
+    assert time.monotonic() - start < 0.1
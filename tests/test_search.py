@@ -0,0 +1,53 @@
+from champions import ChampionCatalog, ChampionSearchIndex
+
+CHAMPIONS = {
+    '1': {'id': 1, 'name': '黑暗之女', 'alias': 'Annie', 'title': '安妮', 'positions': ['MIDDLE', 'UTILITY']},
+    '4': {'id': 4, 'name': '卡牌大师', 'alias': 'TwistedFate', 'title': '崔斯特', 'positions': ['MIDDLE']},
+    '96': {'id': 96, 'name': '深渊巨口', 'alias': "Kog'Maw", 'title': '克格莫', 'positions': ['BOTTOM']},
+    '22': {'id': 22, 'name': '寒冰射手', 'alias': 'Ashe', 'title': '艾希', 'positions': ['BOTTOM']},
+}
+
+
+class FakePinyin:
+    """只认识测试用到的几个字的pypinyin替身"""
+    SYLLABLES = {'卡': 'ka', '牌': 'pai', '大': 'da', '师': 'shi', '寒': 'han', '冰': 'bing'}
+
+    def lazy_pinyin(self, text):
+        return [self.SYLLABLES.get(char, '') for char in text]
+
+
+def test_search_by_name_title_and_alias_prefix():
+    catalog = ChampionCatalog(CHAMPIONS)
+    assert catalog.search('卡牌') == [4]
+    assert catalog.search('艾') == [22]
+    assert catalog.search('an') == [1]
+    assert catalog.search('A') == [1, 22]
+    assert catalog.search('xyz') == []
+
+
+def test_search_ignores_case_spaces_and_punctuation():
+    catalog = ChampionCatalog(CHAMPIONS)
+    assert catalog.search('kogmaw') == [96]
+    assert catalog.search("KOG'M") == [96]
+    assert catalog.search('twisted fate') == [4]
+
+
+def test_empty_query_returns_all_in_catalog_order():
+    catalog = ChampionCatalog(CHAMPIONS)
+    assert catalog.search('') == [1, 4, 96, 22]
+    assert catalog.search('  ', position='BOTTOM') == [96, 22]
+
+
+def test_search_filters_by_position():
+    catalog = ChampionCatalog(CHAMPIONS)
+    assert catalog.search('a', position='MIDDLE') == [1]
+    assert catalog.search('a', position='TOP') == []
+
+
+def test_pinyin_and_initials_when_pypinyin_available():
+    index = ChampionSearchIndex(ChampionCatalog(CHAMPIONS), pypinyin=FakePinyin())
+    assert list(index.search('kapai')) == [4]
+    assert list(index.search('kpds')) == [4]
+    assert list(index.search('hb')) == [22]
+    # 同一英雄的多个键经过同一前缀时只出现一次
+    assert list(index.search('a')) == [1, 22]
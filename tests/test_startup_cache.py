@@ -0,0 +1,65 @@
+import json
+import marshal
+import os
+import shutil
+
+import pytest
+
+import champions
+from champions import cache_path_for, load_champions_data
+
+
+@pytest.fixture
+def data_file(tmp_path, champions_file):
+    path = str(tmp_path / 'ai_champions_data.json')
+    shutil.copy(champions_file, path)
+    return path
+
+
+@pytest.fixture
+def forbid_parse(monkeypatch):
+    """调用后的加载不允许再解析JSON"""
+    def unexpected_loads(*args, **kwargs):
+        raise AssertionError("应使用启动缓存")
+
+    return lambda: monkeypatch.setattr(champions.json, 'loads', unexpected_loads)
+
+
+def test_second_load_uses_cache(data_file, catalog, forbid_parse):
+    assert load_champions_data(data_file) == catalog
+    assert os.path.exists(cache_path_for(data_file))
+    forbid_parse()
+    cached = load_champions_data(data_file)
+    assert cached == catalog
+    assert cached.position_ids == catalog.position_ids
+
+
+def test_touched_file_reuses_cache_by_hash(data_file, catalog, forbid_parse):
+    load_champions_data(data_file)
+    st = os.stat(data_file)
+    os.utime(data_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    forbid_parse()
+    assert load_champions_data(data_file) == catalog
+    # 缓存中的修改时间已更新，之后按修改时间直接命中
+    with open(cache_path_for(data_file), 'rb') as f:
+        _, stamp, *_ = marshal.loads(f.read())
+    assert stamp == (st.st_mtime_ns + 10 ** 9, st.st_size)
+
+
+def test_edited_file_invalidates_cache(data_file):
+    load_champions_data(data_file)
+    with open(data_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    data['1']['enable'] = 0
+    with open(data_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    assert '1' not in load_champions_data(data_file)
+    assert '1' not in load_champions_data(data_file)
+
+
+@pytest.mark.parametrize("payload", [b"not marshal", marshal.dumps(((0, 0), None, None, [], {}))])
+def test_corrupt_or_old_cache_ignored(data_file, catalog, payload):
+    load_champions_data(data_file)
+    with open(cache_path_for(data_file), 'wb') as f:
+        f.write(payload)
+    assert load_champions_data(data_file) == catalog